@@ -44,44 +44,67 @@ If .bsl-language-server.json exists in project root, it will be automatically de
 to the language server with the -c flag.
 """
 
+import contextlib
 import dataclasses
+import functools
 import json
 import logging
 import os
-import pathlib
-import re
 import shutil
-import stat
 import sys
 import threading
-import urllib.request
-from datetime import UTC, datetime
+import time
+import uuid
+import zipfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import IO, Any, cast
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Cross-platform file locking
 # Note: Uses file-based locking for inter-process synchronization during updates.
-# On Windows, locks the first 1024 bytes; on Unix, uses flock for whole-file locking.
+# Both variants lock the whole file: LockFileEx over the maximum byte range on Windows, flock on Unix.
 if sys.platform == "win32":
+    import ctypes
     import msvcrt
+    from ctypes import wintypes
+
+    _LOCKFILE_FAIL_IMMEDIATELY = 0x00000001
+    _LOCKFILE_EXCLUSIVE_LOCK = 0x00000002
+    _MAXDWORD = 0xFFFFFFFF
+
+    class _OVERLAPPED(ctypes.Structure):
+        _fields_ = [
+            ("Internal", ctypes.c_size_t),
+            ("InternalHigh", ctypes.c_size_t),
+            ("Offset", wintypes.DWORD),
+            ("OffsetHigh", wintypes.DWORD),
+            ("hEvent", wintypes.HANDLE),
+        ]
 
-    _LOCK_SIZE = 1024  # Bytes to lock on Windows
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _LockFileEx = _kernel32.LockFileEx
+    _LockFileEx.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.DWORD, wintypes.DWORD, wintypes.DWORD, ctypes.POINTER(_OVERLAPPED)]
+    _LockFileEx.restype = wintypes.BOOL
+    _UnlockFileEx = _kernel32.UnlockFileEx
+    _UnlockFileEx.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.DWORD, wintypes.DWORD, ctypes.POINTER(_OVERLAPPED)]
+    _UnlockFileEx.restype = wintypes.BOOL
 
     def _lock_file(fd: IO[str]) -> bool:
-        """Acquire exclusive lock on file (Windows). Locks first 1024 bytes."""
-        try:
-            fd.seek(0)
-            msvcrt.locking(fd.fileno(), msvcrt.LK_NBLCK, _LOCK_SIZE)
-            return True
-        except OSError:
-            return False
+        """Acquire exclusive lock on file (Windows). Uses LockFileEx over the whole file."""
+        handle = wintypes.HANDLE(msvcrt.get_osfhandle(fd.fileno()))
+        flags = _LOCKFILE_EXCLUSIVE_LOCK | _LOCKFILE_FAIL_IMMEDIATELY
+        return bool(_LockFileEx(handle, flags, 0, _MAXDWORD, _MAXDWORD, ctypes.byref(_OVERLAPPED())))
 
     def _unlock_file(fd: IO[str]) -> None:
         """Release lock on file (Windows)."""
-        try:
-            fd.seek(0)
-            msvcrt.locking(fd.fileno(), msvcrt.LK_UNLCK, _LOCK_SIZE)
-        except OSError:
-            pass
+        handle = wintypes.HANDLE(msvcrt.get_osfhandle(fd.fileno()))
+        _UnlockFileEx(handle, 0, _MAXDWORD, _MAXDWORD, ctypes.byref(_OVERLAPPED()))
 
 else:
     import fcntl
@@ -101,13 +124,52 @@ else:
 
 from solidlsp.ls import SolidLanguageServer
 from solidlsp.ls_config import Language, LanguageServerConfig
-from solidlsp.ls_utils import FileUtils, PlatformUtils
+from solidlsp.ls_utils import FileUtils, PlatformId, PlatformUtils
 from solidlsp.lsp_protocol_handler.lsp_types import InitializeParams
 from solidlsp.lsp_protocol_handler.server import ProcessLaunchInfo
 from solidlsp.settings import SolidLSPSettings
 
 log = logging.getLogger(__name__)
 
+
+@contextlib.contextmanager
+def _update_lock(static_dir: str) -> Iterator[bool]:
+    """
+    Try to acquire the inter-process update lock of the BSL Language Server installation, without blocking.
+
+    Yields True if the lock was acquired (it is released on exit), or False if another process holds it.
+    The lock file is opened in append mode, so it is not truncated on every acquisition.
+    """
+    with open(os.path.join(static_dir, LOCK_FILENAME), "a") as lock_fd:
+        acquired = _lock_file(lock_fd)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                _unlock_file(lock_fd)
+
+
+def _create_http_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all GitHub API requests and downloads.
+
+    Reusing one session keeps TCP/TLS connections alive across the metadata fetch and the
+    subsequent downloads (which are redirected to a different host, hence a pool per host).
+    Retry-After headers are ignored, so that a rate-limited response fails fast instead of blocking the
+    server startup; the caller then falls back to the installed JAR or the cached release.
+    """
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, respect_retry_after_header=False)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
+
+
+_HTTP_SESSION = _create_http_session()
+
+# HTTP status codes with which GitHub signals rate limiting; a stale cached response is used instead
+_RATE_LIMIT_STATUS_CODES = (403, 429)
+
 # Default memory setting for BSL Language Server (used when no explicit memory is configured)
 DEFAULT_BSL_MEMORY = "4G"
 
@@ -120,9 +182,24 @@ BSL_LS_GITHUB_API_URL = "https://api.github.com/repos/1c-syntax/bsl-language-ser
 # GitHub API URL for all releases (used for version pinning)
 BSL_LS_GITHUB_RELEASES_URL = "https://api.github.com/repos/1c-syntax/bsl-language-server/releases"
 
+# GitHub API URL for a single release by tag (used for version pinning)
+BSL_LS_GITHUB_RELEASE_BY_TAG_URL = "https://api.github.com/repos/1c-syntax/bsl-language-server/releases/tags/{tag}"
+
 # Minimum interval between update checks (in seconds) - 1 hour
 UPDATE_CHECK_INTERVAL_SECONDS = 3600
 
+# Cache file for the GitHub "releases/latest" response (validators are kept in a sibling .meta.json file)
+LATEST_RELEASE_CACHE_FILENAME = "latest_release.json"
+
+# Cache file for the GitHub "releases" list response (used to look up pinned versions)
+RELEASES_CACHE_FILENAME = "releases.json"
+
+# Cache file for the GitHub response for a single release (formatted with the quoted tag)
+RELEASE_BY_TAG_CACHE_FILENAME = "release_{tag}.json"
+
+# Maximum age (in seconds) of a cached GitHub response before it is revalidated with a conditional request
+RELEASE_CACHE_TTL_SECONDS = UPDATE_CHECK_INTERVAL_SECONDS
+
 # Version file name
 VERSION_FILENAME = "version.json"
 
@@ -132,23 +209,278 @@ STAGED_DIR_NAME = ".staged"
 # Lock file name for concurrent access
 LOCK_FILENAME = ".update.lock"
 
+# Manifest file (in the bsl-ls directory) recording the installed JAR
+INSTALLED_MANIFEST_FILENAME = "installed.json"
 
-@dataclasses.dataclass
+# Separators for the JSON metadata files written by this module (compact, since they are not meant to be edited by hand)
+_COMPACT_JSON_SEPARATORS = (",", ":")
+
+# Minimum plausible size of the BSL LS JAR (typically ~60MB); anything smaller is clearly corrupt
+_MIN_JAR_SIZE = 1024 * 1024
+
+# -Xmx flag in jvm_options: stripped from the additional options, and its value extracted as the memory setting
+_XMX_PREFIX = "-Xmx"
+_XMX_UNIT_SUFFIXES = "GgMmKk"
+
+# Prefix and suffix of the executable JAR filename around the version, e.g. bsl-language-server-0.28.0-exec.jar
+_JAR_NAME_PREFIX = "bsl-language-server-"
+_JAR_NAME_SUFFIX = "-exec.jar"
+
+
+def _parse_xmx_value(jvm_option: str) -> str | None:
+    """
+    Extract the value of an -Xmx JVM option (e.g. "4G" from "-Xmx4G").
+
+    Args:
+        jvm_option: A single JVM option
+
+    Returns:
+        The memory value (digits with an optional G/M/K unit), or None if the option is not a valid -Xmx flag
+
+    """
+    if not jvm_option.startswith(_XMX_PREFIX):
+        return None
+    value = jvm_option[len(_XMX_PREFIX) :]
+    digits = value[:-1] if value and value[-1] in _XMX_UNIT_SUFFIXES else value
+    return value if digits.isascii() and digits.isdecimal() else None
+
+
+# Java runtime dependencies (same as Kotlin Language Server)
+_JAVA_DEPENDENCIES: dict[str, dict[str, str]] = {
+    "win-x64": {
+        "url": "https://github.com/redhat-developer/vscode-java/releases/download/v1.42.0/java-win32-x64-1.42.0-561.vsix",
+        "archiveType": "zip",
+        "java_home_path": "extension/jre/21.0.7-win32-x86_64",
+        "java_path": "extension/jre/21.0.7-win32-x86_64/bin/java.exe",
+    },
+    "linux-x64": {
+        "url": "https://github.com/redhat-developer/vscode-java/releases/download/v1.42.0/java-linux-x64-1.42.0-561.vsix",
+        "archiveType": "zip",
+        "java_home_path": "extension/jre/21.0.7-linux-x86_64",
+        "java_path": "extension/jre/21.0.7-linux-x86_64/bin/java",
+    },
+    "linux-arm64": {
+        "url": "https://github.com/redhat-developer/vscode-java/releases/download/v1.42.0/java-linux-arm64-1.42.0-561.vsix",
+        "archiveType": "zip",
+        "java_home_path": "extension/jre/21.0.7-linux-aarch64",
+        "java_path": "extension/jre/21.0.7-linux-aarch64/bin/java",
+    },
+    "osx-x64": {
+        "url": "https://github.com/redhat-developer/vscode-java/releases/download/v1.42.0/java-darwin-x64-1.42.0-561.vsix",
+        "archiveType": "zip",
+        "java_home_path": "extension/jre/21.0.7-macosx-x86_64",
+        "java_path": "extension/jre/21.0.7-macosx-x86_64/bin/java",
+    },
+    "osx-arm64": {
+        "url": "https://github.com/redhat-developer/vscode-java/releases/download/v1.42.0/java-darwin-arm64-1.42.0-561.vsix",
+        "archiveType": "zip",
+        "java_home_path": "extension/jre/21.0.7-macosx-aarch64",
+        "java_path": "extension/jre/21.0.7-macosx-aarch64/bin/java",
+    },
+}
+
+
+@functools.cache
+def _get_platform_id() -> PlatformId:
+    """
+    Returns the platform id for the current system, determined once per process since it cannot change at runtime.
+    """
+    return PlatformUtils.get_platform_id()
+
+
+# LSP symbol kinds supported by the client (File = 1 ... TypeParameter = 26)
+_SYMBOL_KIND_VALUE_SET = list(range(1, 27))
+
+# LSP completion item kinds supported by the client (Text = 1 ... TypeParameter = 25)
+_COMPLETION_ITEM_KIND_VALUE_SET = list(range(1, 26))
+
+# Client identification sent in the initialize request (shared, must not be mutated)
+_CLIENT_INFO = {"name": "Serena BSL Client", "version": "1.0.0"}
+
+# Static client capabilities sent in the initialize request (shared, must not be mutated)
+_CLIENT_CAPABILITIES: dict[str, Any] = {
+    "workspace": {
+        "applyEdit": True,
+        "workspaceEdit": {
+            "documentChanges": True,
+            "resourceOperations": ["create", "rename", "delete"],
+            "failureHandling": "textOnlyTransactional",
+            "normalizesLineEndings": True,
+        },
+        "didChangeConfiguration": {"dynamicRegistration": True},
+        "didChangeWatchedFiles": {"dynamicRegistration": True, "relativePatternSupport": True},
+        "symbol": {
+            "dynamicRegistration": True,
+            "symbolKind": {"valueSet": _SYMBOL_KIND_VALUE_SET},
+            "tagSupport": {"valueSet": [1]},
+        },
+        "codeLens": {"refreshSupport": True},
+        "executeCommand": {"dynamicRegistration": True},
+        "configuration": True,
+        "workspaceFolders": True,
+        "diagnostics": {"refreshSupport": True},
+    },
+    "textDocument": {
+        # Pushed diagnostics are dropped by the client (see _start_server), so no optional diagnostic fields are requested
+        "publishDiagnostics": {"relatedInformation": False, "versionSupport": False},
+        "synchronization": {"dynamicRegistration": True, "willSave": True, "willSaveWaitUntil": True, "didSave": True},
+        "completion": {
+            "dynamicRegistration": True,
+            "contextSupport": True,
+            "completionItem": {
+                "snippetSupport": False,
+                "commitCharactersSupport": True,
+                "documentationFormat": ["markdown", "plaintext"],
+                "deprecatedSupport": True,
+                "preselectSupport": True,
+                "tagSupport": {"valueSet": [1]},
+                "insertReplaceSupport": False,
+                "resolveSupport": {"properties": ["documentation", "detail", "additionalTextEdits"]},
+                "insertTextModeSupport": {"valueSet": [1, 2]},
+                "labelDetailsSupport": True,
+            },
+            "insertTextMode": 2,
+            "completionItemKind": {"valueSet": _COMPLETION_ITEM_KIND_VALUE_SET},
+        },
+        "hover": {"dynamicRegistration": True, "contentFormat": ["markdown", "plaintext"]},
+        "signatureHelp": {
+            "dynamicRegistration": True,
+            "signatureInformation": {
+                "documentationFormat": ["markdown", "plaintext"],
+                "parameterInformation": {"labelOffsetSupport": True},
+                "activeParameterSupport": True,
+            },
+            "contextSupport": True,
+        },
+        "definition": {"dynamicRegistration": True, "linkSupport": True},
+        "references": {"dynamicRegistration": True},
+        "documentHighlight": {"dynamicRegistration": True},
+        "documentSymbol": {
+            "dynamicRegistration": True,
+            "symbolKind": {"valueSet": _SYMBOL_KIND_VALUE_SET},
+            "hierarchicalDocumentSymbolSupport": True,
+            "tagSupport": {"valueSet": [1]},
+            "labelSupport": True,
+        },
+        "codeAction": {
+            "dynamicRegistration": True,
+            "isPreferredSupport": True,
+            "disabledSupport": True,
+            "dataSupport": True,
+            "resolveSupport": {"properties": ["edit"]},
+            "codeActionLiteralSupport": {
+                "codeActionKind": {
+                    "valueSet": [
+                        "",
+                        "quickfix",
+                        "refactor",
+                        "refactor.extract",
+                        "refactor.inline",
+                        "refactor.rewrite",
+                        "source",
+                        "source.organizeImports",
+                    ]
+                }
+            },
+            "honorsChangeAnnotations": False,
+        },
+        "codeLens": {"dynamicRegistration": True},
+        "formatting": {"dynamicRegistration": True},
+        "rangeFormatting": {"dynamicRegistration": True},
+        "rename": {
+            "dynamicRegistration": True,
+            "prepareSupport": True,
+            "prepareSupportDefaultBehavior": 1,
+            "honorsChangeAnnotations": True,
+        },
+        "documentLink": {"dynamicRegistration": True, "tooltipSupport": True},
+        "foldingRange": {
+            "dynamicRegistration": True,
+            "rangeLimit": 5000,
+            "lineFoldingOnly": True,
+            "foldingRangeKind": {"valueSet": ["comment", "imports", "region"]},
+        },
+        "callHierarchy": {"dynamicRegistration": True},
+    },
+    "window": {
+        "showMessage": {"messageActionItem": {"additionalPropertiesSupport": True}},
+        "showDocument": {"support": True},
+        "workDoneProgress": True,
+    },
+    "general": {
+        "staleRequestSupport": {"cancel": True, "retryOnContentModified": []},
+        "regularExpressions": {"engine": "ECMAScript", "version": "ES2020"},
+        "positionEncodings": ["utf-16"],
+    },
+}
+
+
+def _path_to_file_uri(absolute_path: str) -> str:
+    """
+    Convert an absolute file system path to a file URI (as pathlib.Path.as_uri does, without constructing a Path).
+    """
+    if os.name == "nt":
+        uri_path = absolute_path.replace("\\", "/")
+        if uri_path.startswith("//"):
+            # UNC path: the server becomes the URI authority
+            return "file:" + quote(uri_path, safe="/:")
+        return "file:///" + quote(uri_path, safe="/:")
+    # Encode with the file system encoding, so that undecodable bytes (surrogate escapes) are percent-encoded as is
+    return "file://" + quote(os.fsencode(absolute_path))
+
+
+@functools.lru_cache(maxsize=8)
+def _build_initialize_params(repository_absolute_path: str) -> dict[str, Any]:
+    """
+    Build the initialize params for the given repository, except for the process id.
+    The result is cached, since it only depends on the path.
+    """
+    root_uri = _path_to_file_uri(repository_absolute_path)
+    initialize_params = {
+        "clientInfo": _CLIENT_INFO,
+        "locale": "ru",
+        "rootPath": repository_absolute_path,
+        "rootUri": root_uri,
+        "capabilities": _CLIENT_CAPABILITIES,
+        "initializationOptions": {
+            "workspaceFolders": [root_uri],
+        },
+        "trace": "off",
+        "workspaceFolders": [
+            {
+                "uri": root_uri,
+                "name": os.path.basename(repository_absolute_path),
+            }
+        ],
+    }
+    return initialize_params
+
+
+def _do_nothing(params: dict) -> None:
+    return
+
+
+def _window_log_message(msg: dict) -> None:
+    log.info(f"LSP: window/logMessage: {msg}")
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class VersionInfo:
     """
     Stores version metadata for BSL Language Server.
+    Instances are immutable; use dataclasses.replace to derive updated version info.
 
     Attributes:
         current: Currently active version (e.g., "0.28.0")
         staged: Downloaded but not yet activated version (e.g., "0.29.0"), or None
-        last_check: ISO 8601 timestamp of last update check, or None
+        last_check: Unix time (in seconds) of last update check, or None
         pinned: Pinned version if set in config, or None
 
     """
 
     current: str | None = None
     staged: str | None = None
-    last_check: str | None = None
+    last_check: int | None = None
     pinned: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
@@ -163,12 +495,46 @@ class VersionInfo:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "VersionInfo":
         """Create VersionInfo from dictionary."""
-        return cls(
-            current=data.get("current"),
-            staged=data.get("staged"),
-            last_check=data.get("last_check"),
-            pinned=data.get("pinned"),
-        )
+        # positional arguments in field order (current, staged, last_check, pinned)
+        return cls(data.get("current"), data.get("staged"), cls._parse_last_check(data.get("last_check")), data.get("pinned"))
+
+    @staticmethod
+    def _parse_last_check(value: Any) -> int | None:
+        """Parse the stored last check time, accepting the ISO 8601 timestamps written by earlier versions."""
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            try:
+                return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+            except ValueError:
+                return None
+        return None
+
+
+@dataclasses.dataclass(frozen=True)
+class BslReleaseAsset:
+    """
+    Describes the executable JAR asset of a BSL Language Server release on GitHub.
+
+    Attributes:
+        download_url: URL to download the JAR from
+        version: Release tag (e.g., "v0.28.0")
+        size: Size of the JAR in bytes as reported by GitHub, or None if unknown
+        sha256: Hex SHA-256 digest of the JAR as reported by GitHub, or None if unknown
+
+    """
+
+    download_url: str
+    version: str
+    size: int | None = None
+    sha256: str | None = None
+
+    @classmethod
+    def from_github_asset(cls, asset: dict[str, Any], version: str) -> "BslReleaseAsset":
+        """Create BslReleaseAsset from an asset of a GitHub release API response."""
+        digest = asset.get("digest")
+        sha256 = digest.removeprefix("sha256:") if isinstance(digest, str) and digest.startswith("sha256:") else None
+        return cls(asset.get("browser_download_url", ""), version, asset.get("size"), sha256)
 
 
 @dataclasses.dataclass
@@ -180,6 +546,8 @@ class BslRuntimeDependencyPaths:
     java_path: str
     java_home_path: str
     bsl_jar_path: str
+    pending_update_check: Callable[[], None] | None = None
+    """starts the background update check; deferred until the server process has been launched, or None if not needed"""
 
 
 class BslLanguageServer(SolidLanguageServer):
@@ -188,6 +556,15 @@ class BslLanguageServer(SolidLanguageServer):
     Contains various configurations and settings specific to BSL.
     """
 
+    # In-process memo of resolved release assets, keyed by (release, cache_dir), with the monotonic time they were resolved
+    _release_memo: dict[tuple[str, str | None], tuple[float, BslReleaseAsset]] = {}
+    _release_memo_lock = threading.Lock()
+
+    # In-process cache of parsed version.json files, keyed by path, with the (st_ino, st_mtime_ns, st_size) they were read at;
+    # the inode changes on every atomic rewrite, even when the mtime resolution is too coarse to tell two writes apart
+    _version_info_cache: dict[str, tuple[tuple[int, int, int], VersionInfo]] = {}
+    _version_info_cache_lock = threading.Lock()
+
     def __init__(self, config: LanguageServerConfig, repository_root_path: str, solidlsp_settings: SolidLSPSettings):
         """
         Creates a BSL Language Server instance.
@@ -196,23 +573,7 @@ class BslLanguageServer(SolidLanguageServer):
         runtime_dependency_paths = self._setup_runtime_dependencies(config, solidlsp_settings)
         self.runtime_dependency_paths = runtime_dependency_paths
 
-        # Get memory setting using priority: explicit memory > jvm_options -Xmx > default
-        memory_setting = self._get_memory_setting(solidlsp_settings)
-
-        # Build JVM options with memory setting
-        jvm_args = [f"-Xmx{memory_setting}"]
-
-        # Add additional JVM options if specified (excluding -Xmx which we already handle)
-        if solidlsp_settings.ls_specific_settings:
-            bsl_settings = solidlsp_settings.get_ls_specific_settings(Language.BSL)
-            custom_jvm_options = bsl_settings.get("jvm_options", "")
-            if custom_jvm_options:
-                # Filter out -Xmx flags since we handle memory separately
-                filtered_options = re.sub(r"-Xmx\d+[GgMm]?\s*", "", custom_jvm_options).strip()
-                if filtered_options:
-                    jvm_args.extend(filtered_options.split())
-                    log.info(f"Using additional JVM options for BSL Language Server: {filtered_options}")
-
+        jvm_args = self._get_jvm_args(solidlsp_settings)
         log.info(f"BSL Language Server JVM args: {jvm_args}")
 
         # Build command to run BSL Language Server
@@ -239,6 +600,36 @@ class BslLanguageServer(SolidLanguageServer):
             config, repository_root_path, ProcessLaunchInfo(cmd=cmd, env=proc_env, cwd=repository_root_path), "bsl", solidlsp_settings
         )
 
+    @classmethod
+    def _get_jvm_args(cls, solidlsp_settings: SolidLSPSettings) -> list[str]:
+        """
+        Build the JVM arguments for launching BSL Language Server.
+
+        The memory limit is always passed as a single -Xmx flag (see _get_memory_setting);
+        any other options from `jvm_options` in ls_specific_settings.bsl are appended as-is.
+
+        Args:
+            solidlsp_settings: The SolidLSP settings object
+
+        Returns:
+            List of JVM arguments (e.g., ["-Xmx4G", "-XX:+UseG1GC"])
+
+        """
+        # Get memory setting using priority: explicit memory > jvm_options -Xmx > default
+        jvm_args = [f"-Xmx{cls._get_memory_setting(solidlsp_settings)}"]
+
+        # Add additional JVM options if specified (excluding -Xmx which we already handle)
+        if solidlsp_settings.ls_specific_settings:
+            custom_jvm_options = solidlsp_settings.get_ls_specific_settings(Language.BSL).get("jvm_options", "")
+            if custom_jvm_options:
+                # Filter out -Xmx flags (also malformed ones) since we handle memory separately
+                filtered_options = [option for option in custom_jvm_options.split() if not option.startswith(_XMX_PREFIX)]
+                if filtered_options:
+                    jvm_args.extend(filtered_options)
+                    log.info(f"Using additional JVM options for BSL Language Server: {' '.join(filtered_options)}")
+
+        return jvm_args
+
     @staticmethod
     def _get_memory_setting(solidlsp_settings: SolidLSPSettings) -> str:
         """
@@ -269,10 +660,9 @@ class BslLanguageServer(SolidLanguageServer):
 
         # Priority 2: Extract from jvm_options if present
         jvm_options = bsl_settings.get("jvm_options", "")
-        if jvm_options:
-            match = re.search(r"-Xmx(\d+[GgMm]?)", jvm_options)
-            if match:
-                memory_value = match.group(1)
+        for jvm_option in jvm_options.split():
+            memory_value = _parse_xmx_value(jvm_option)
+            if memory_value is not None:
                 log.info(f"Extracted memory from jvm_options for BSL Language Server: {memory_value}")
                 return memory_value
 
@@ -297,80 +687,223 @@ class BslLanguageServer(SolidLanguageServer):
             return config_path
         return None
 
+    @staticmethod
+    def _write_file_atomic(path: str, data: bytes, fsync: bool = False) -> None:
+        """
+        Write data to a file atomically by writing to a temporary file and renaming it.
+
+        Args:
+            path: Target file path
+            data: Bytes to write
+            fsync: Whether to flush the data to disk before the rename, so that a crash cannot leave an empty file behind
+
+        """
+        temp_path = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(data)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    @classmethod
+    def _fetch_github_json(cls, url: str, cache_dir: str | None = None, cache_filename: str | None = None) -> Any:
+        """
+        Fetch a JSON document from the GitHub API, optionally backed by an on-disk cache.
+
+        If a cache location is given, a cached response younger than RELEASE_CACHE_TTL_SECONDS is returned
+        without any network access. Older responses are revalidated with If-None-Match/If-Modified-Since
+        (built from the cached ETag/Last-Modified headers), and a 304 response is served from the cache.
+        304 responses do not count against GitHub's API rate limit.
+
+        Args:
+            url: GitHub API URL to fetch
+            cache_dir: Directory to cache the response in, or None to disable caching
+            cache_filename: Name of the cache file within cache_dir
+
+        Returns:
+            The parsed JSON response
+
+        """
+        headers = {
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "Serena-SolidLSP",
+        }
+
+        cache_path = None
+        meta_path = None
+        meta: dict[str, Any] = {}
+        cached_data = None
+        if cache_dir is not None and cache_filename is not None:
+            cache_path = os.path.join(cache_dir, cache_filename)
+            meta_path = os.path.splitext(cache_path)[0] + ".meta.json"
+            try:
+                with open(cache_path, encoding="utf-8") as f:
+                    cached_data = json.load(f)
+                with open(meta_path, encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                meta = {}
+
+        if cached_data is not None:
+            fetched_at = meta.get("fetched_at")
+            if isinstance(fetched_at, int | float) and time.time() - fetched_at < RELEASE_CACHE_TTL_SECONDS:
+                log.debug(f"Using cached GitHub response for {url}")
+                return cached_data
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = _HTTP_SESSION.get(url, headers=headers, timeout=30)
+
+        if response.status_code == 304 and cache_path is not None and meta_path is not None:
+            log.debug(f"GitHub response for {url} not modified, using cached copy")
+            meta["fetched_at"] = time.time()
+            try:
+                cls._write_file_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+            except OSError as e:
+                log.warning(f"Failed to update GitHub response cache metadata: {e}")
+            return cached_data
+
+        if response.status_code in _RATE_LIMIT_STATUS_CODES and cached_data is not None:
+            log.warning(f"GitHub rate limit reached for {url} (HTTP {response.status_code}), using stale cached copy")
+            return cached_data
+
+        response.raise_for_status()
+        raw_data = response.content
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        # json.loads accepts the UTF-8 bytes directly, without an intermediate str copy of the payload
+        data = json.loads(raw_data)
+
+        if cache_path is not None and meta_path is not None:
+            try:
+                cls._write_file_atomic(cache_path, raw_data)
+                new_meta = {"etag": etag, "last_modified": last_modified, "fetched_at": time.time()}
+                cls._write_file_atomic(meta_path, json.dumps(new_meta).encode("utf-8"))
+            except OSError as e:
+                log.warning(f"Failed to cache GitHub response: {e}")
+
+        return data
+
+    @classmethod
+    def _get_memoized_release(cls, key: tuple[str, str | None]) -> BslReleaseAsset | None:
+        """
+        Return a release asset resolved earlier in this process, if it is younger than RELEASE_CACHE_TTL_SECONDS.
+
+        Args:
+            key: Tuple of (release, cache_dir) identifying the lookup
+
+        Returns:
+            The memoized release asset, or None if there is none or it has expired
+
+        """
+        with cls._release_memo_lock:
+            entry = cls._release_memo.get(key)
+        if entry is not None and time.monotonic() - entry[0] < RELEASE_CACHE_TTL_SECONDS:
+            return entry[1]
+        return None
+
+    @classmethod
+    def _memoize_release(cls, key: tuple[str, str | None], release_asset: BslReleaseAsset) -> None:
+        """
+        Remember a resolved release asset for subsequent lookups in this process.
+
+        Args:
+            key: Tuple of (release, cache_dir) identifying the lookup
+            release_asset: The resolved release asset
+
+        """
+        with cls._release_memo_lock:
+            cls._release_memo[key] = (time.monotonic(), release_asset)
+
     @classmethod
-    def _get_latest_bsl_release_url(cls) -> tuple[str, str]:
+    def _get_latest_bsl_release_url(cls, cache_dir: str | None = None) -> BslReleaseAsset:
         """
         Fetches the latest release URL from GitHub API.
 
+        Args:
+            cache_dir: Directory to cache the GitHub response in (see _fetch_github_json), or None to disable caching
+
         Returns:
-            Tuple of (download_url, version)
+            The executable JAR asset of the latest release
 
         """
-        log.info("Fetching latest BSL Language Server release from GitHub...")
+        memo_key = ("latest", cache_dir)
+        memoized = cls._get_memoized_release(memo_key)
+        if memoized is not None:
+            return memoized
 
-        request = urllib.request.Request(
-            BSL_LS_GITHUB_API_URL,
-            headers={
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "Serena-SolidLSP",
-            },
-        )
+        log.info("Fetching latest BSL Language Server release from GitHub...")
 
-        with urllib.request.urlopen(request, timeout=30) as response:
-            release_data = json.loads(response.read().decode("utf-8"))
+        release_data = cls._fetch_github_json(BSL_LS_GITHUB_API_URL, cache_dir, LATEST_RELEASE_CACHE_FILENAME)
 
         version = release_data.get("tag_name", "unknown")
         assets = release_data.get("assets", [])
 
         # Find the executable JAR (ends with -exec.jar)
-        for asset in assets:
-            name = asset.get("name", "")
-            if name.endswith("-exec.jar"):
-                download_url = asset.get("browser_download_url")
-                log.info(f"Found BSL Language Server {version}: {name}")
-                return download_url, version
+        exec_jar = next(filter(cls._is_exec_jar_asset, assets), None)
+        if exec_jar is None:
+            raise RuntimeError("Could not find BSL Language Server executable JAR in latest release")
 
-        raise RuntimeError("Could not find BSL Language Server executable JAR in latest release")
+        log.info(f"Found BSL Language Server {version}: {exec_jar['name']}")
+        release_asset = BslReleaseAsset.from_github_asset(exec_jar, version)
+        cls._memoize_release(memo_key, release_asset)
+        return release_asset
 
     @classmethod
-    def _get_release_url_for_version(cls, version: str) -> tuple[str, str] | None:
+    def _get_release_url_for_version(cls, version: str, cache_dir: str | None = None) -> BslReleaseAsset | None:
         """
         Fetches the release URL for a specific version from GitHub API.
 
         Args:
             version: The version to fetch (e.g., "0.28.0" or "v0.28.0")
+            cache_dir: Directory to cache the GitHub response in (see _fetch_github_json), or None to disable caching
 
         Returns:
-            Tuple of (download_url, version) if found, None otherwise
+            The executable JAR asset of the release if found, None otherwise
 
         """
         # Normalize version - ensure it has 'v' prefix for comparison
         normalized_version = version if version.startswith("v") else f"v{version}"
 
-        log.info(f"Fetching BSL Language Server release {normalized_version} from GitHub...")
+        memo_key = (normalized_version, cache_dir)
+        memoized = cls._get_memoized_release(memo_key)
+        if memoized is not None:
+            return memoized
 
-        request = urllib.request.Request(
-            BSL_LS_GITHUB_RELEASES_URL,
-            headers={
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "Serena-SolidLSP",
-            },
-        )
+        log.info(f"Fetching BSL Language Server release {normalized_version} from GitHub...")
 
         try:
-            with urllib.request.urlopen(request, timeout=30) as response:
-                releases = json.loads(response.read().decode("utf-8"))
-
-            for release in releases:
-                tag = release.get("tag_name", "")
-                if tag in (normalized_version, version):
-                    assets = release.get("assets", [])
-                    for asset in assets:
-                        name = asset.get("name", "")
-                        if name.endswith("-exec.jar"):
-                            download_url = asset.get("browser_download_url")
-                            log.info(f"Found BSL Language Server {tag}: {name}")
-                            return download_url, tag
+            # Fetch just the requested release; only search the list of all releases if the tag does not exist as given
+            # (e.g. tags without the "v" prefix)
+            quoted_tag = quote(normalized_version, safe="")
+            try:
+                release_data = cls._fetch_github_json(
+                    BSL_LS_GITHUB_RELEASE_BY_TAG_URL.format(tag=quoted_tag),
+                    cache_dir,
+                    RELEASE_BY_TAG_CACHE_FILENAME.format(tag=quoted_tag),
+                )
+                releases = [release_data]
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code != 404:
+                    raise
+                releases = cls._fetch_github_json(BSL_LS_GITHUB_RELEASES_URL, cache_dir, RELEASES_CACHE_FILENAME)
+
+            release = next((release for release in releases if release.get("tag_name") in (normalized_version, version)), None)
+            if release is not None:
+                exec_jar = next(filter(cls._is_exec_jar_asset, release.get("assets", [])), None)
+                if exec_jar is not None:
+                    tag = release["tag_name"]
+                    log.info(f"Found BSL Language Server {tag}: {exec_jar['name']}")
+                    release_asset = BslReleaseAsset.from_github_asset(exec_jar, tag)
+                    cls._memoize_release(memo_key, release_asset)
+                    return release_asset
         except Exception as e:
             log.warning(f"Failed to fetch release {version}: {e}")
 
@@ -389,14 +922,29 @@ class BslLanguageServer(SolidLanguageServer):
 
         """
         version_file = os.path.join(static_dir, VERSION_FILENAME)
-        if os.path.exists(version_file):
-            try:
-                with open(version_file, encoding="utf-8") as f:
-                    data = json.load(f)
-                return VersionInfo.from_dict(data)
-            except (json.JSONDecodeError, OSError) as e:
-                log.warning(f"Failed to read version.json: {e}")
-        return VersionInfo()
+        try:
+            st = os.stat(version_file)
+        except OSError:
+            return VersionInfo()
+
+        # The file is unchanged since it was last read or written by this process: skip re-reading it
+        file_key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        with cls._version_info_cache_lock:
+            cached = cls._version_info_cache.get(version_file)
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
+
+        try:
+            with open(version_file, "rb") as f:
+                data = json.loads(f.read())
+            version_info = VersionInfo.from_dict(data)
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+            log.warning(f"Failed to read version.json: {e}")
+            return VersionInfo()
+
+        with cls._version_info_cache_lock:
+            cls._version_info_cache[version_file] = (file_key, version_info)
+        return version_info
 
     @classmethod
     def _write_version_info(cls, static_dir: str, version_info: VersionInfo) -> None:
@@ -410,10 +958,159 @@ class BslLanguageServer(SolidLanguageServer):
         """
         version_file = os.path.join(static_dir, VERSION_FILENAME)
         try:
-            with open(version_file, "w", encoding="utf-8") as f:
-                json.dump(version_info.to_dict(), f, indent=2)
+            cls._write_file_atomic(
+                version_file, json.dumps(version_info.to_dict(), separators=_COMPACT_JSON_SEPARATORS).encode("utf-8"), fsync=True
+            )
+            st = os.stat(version_file)
         except OSError as e:
             log.warning(f"Failed to write version.json: {e}")
+            with cls._version_info_cache_lock:
+                cls._version_info_cache.pop(version_file, None)
+            return
+
+        with cls._version_info_cache_lock:
+            cls._version_info_cache[version_file] = ((st.st_ino, st.st_mtime_ns, st.st_size), version_info)
+
+    @classmethod
+    def _read_installed_manifest(cls, bsl_dir: str) -> tuple[str, str | None] | None:
+        """
+        Read the installed JAR recorded in the manifest file.
+
+        Args:
+            bsl_dir: Path to the bsl-ls directory containing JAR files
+
+        Returns:
+            Tuple of (jar_path, version), or None if there is no valid manifest or the recorded JAR no longer exists
+
+        """
+        manifest_file = os.path.join(bsl_dir, INSTALLED_MANIFEST_FILENAME)
+        try:
+            with open(manifest_file, encoding="utf-8") as f:
+                data = json.load(f)
+            jar_path = os.path.join(bsl_dir, data["jar"])
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, OSError, KeyError, TypeError) as e:
+            log.warning(f"Failed to read {INSTALLED_MANIFEST_FILENAME}: {e}")
+            return None
+        if not os.path.exists(jar_path):
+            return None
+        return jar_path, data.get("version")
+
+    @classmethod
+    def _write_installed_manifest(cls, bsl_dir: str, jar_path: str, version: str | None) -> None:
+        """
+        Record the installed JAR in the manifest file, so that it can be found without scanning the directory.
+
+        Args:
+            bsl_dir: Path to the bsl-ls directory containing JAR files
+            jar_path: Path to the installed JAR file
+            version: Version of the installed JAR
+
+        """
+        manifest_file = os.path.join(bsl_dir, INSTALLED_MANIFEST_FILENAME)
+        data = {"jar": os.path.basename(jar_path), "version": version}
+        try:
+            cls._write_file_atomic(manifest_file, json.dumps(data, separators=_COMPACT_JSON_SEPARATORS).encode("utf-8"))
+        except OSError as e:
+            log.warning(f"Failed to write {INSTALLED_MANIFEST_FILENAME}: {e}")
+
+    @staticmethod
+    def _is_download_complete(path: str, expected_size: int | None, expected_sha256: str | None = None) -> bool:
+        """
+        Check whether a previously downloaded file matches the expected release asset, so it need not be downloaded again.
+
+        The size is compared first; the (more expensive) checksum is only computed if the size matches.
+
+        Args:
+            path: Path to the downloaded file
+            expected_size: Size of the release asset in bytes, or None if unknown
+            expected_sha256: Hex SHA-256 digest of the release asset, or None to check the size only
+
+        Returns:
+            True if the file exists and has the expected size (and checksum, if given)
+
+        """
+        if expected_size is None:
+            return False
+        try:
+            if os.path.getsize(path) != expected_size:
+                return False
+            return expected_sha256 is None or FileUtils.calculate_sha256(path).lower() == expected_sha256.lower()
+        except OSError:
+            return False
+
+    @staticmethod
+    def _is_viable_jar(path: str) -> bool:
+        """
+        Check whether a JAR file is a readable zip archive, so that a truncated or corrupt JAR is detected before Java is started.
+
+        Only the central directory is read (no entries are decompressed), which catches truncated downloads cheaply.
+
+        Args:
+            path: Path to the JAR file
+
+        Returns:
+            True if the file can be opened as a zip archive with at least one entry, False if it is missing or not a
+            zip archive (which includes empty and truncated files). If the file cannot be read for any other reason
+            (e.g. it is temporarily locked by a virus scanner), it is kept and considered viable.
+
+        """
+        try:
+            with zipfile.ZipFile(path) as jar:
+                return len(jar.infolist()) > 0
+        except (zipfile.BadZipFile, FileNotFoundError):
+            return False
+        except OSError as e:
+            log.warning(f"Could not check BSL Language Server JAR {path}, keeping it: {e}")
+            return True
+
+    @staticmethod
+    def _is_exec_jar(name: str) -> bool:
+        """
+        Check whether a file or asset name denotes an executable BSL Language Server JAR (e.g. bsl-language-server-0.28.0-exec.jar).
+
+        Args:
+            name: File or asset name
+
+        Returns:
+            True if the name has the executable JAR suffix
+
+        """
+        return name.endswith(_JAR_NAME_SUFFIX)
+
+    @classmethod
+    def _is_exec_jar_asset(cls, asset: dict[str, Any]) -> bool:
+        """
+        Check whether an asset of a GitHub release API response is the executable BSL Language Server JAR.
+
+        Args:
+            asset: Asset entry of a GitHub release
+
+        Returns:
+            True if the asset name has the executable JAR suffix
+
+        """
+        return cls._is_exec_jar(asset.get("name", ""))
+
+    @classmethod
+    def _find_exec_jar(cls, directory: str) -> os.DirEntry[str] | None:
+        """
+        Find an executable JAR in the given directory, stopping at the first match.
+        Entries are filtered by name first; the file type check uses the type information cached by scandir.
+
+        Args:
+            directory: Directory to search
+
+        Returns:
+            Directory entry of the first executable JAR found, or None if there is none or the directory does not exist
+
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return next((entry for entry in entries if cls._is_exec_jar(entry.name) and entry.is_file()), None)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
 
     @classmethod
     def _extract_version_from_jar_name(cls, jar_name: str) -> str | None:
@@ -427,11 +1124,14 @@ class BslLanguageServer(SolidLanguageServer):
             Version string (e.g., "v0.28.0") or None if not found
 
         """
-        # Pattern: bsl-language-server-X.Y.Z-exec.jar
-        match = re.search(r"bsl-language-server-(\d+\.\d+\.\d+)-exec\.jar", jar_name)
-        if match:
-            return f"v{match.group(1)}"
-        return None
+        if not (jar_name.startswith(_JAR_NAME_PREFIX) and jar_name.endswith(_JAR_NAME_SUFFIX)):
+            return None
+        version = jar_name.removeprefix(_JAR_NAME_PREFIX).removesuffix(_JAR_NAME_SUFFIX)
+        parts = version.split(".")
+        # isdecimal() alone would also accept non-ASCII (e.g. Arabic-Indic) digits
+        if len(parts) != 3 or not version.isascii() or not all(part.isdecimal() for part in parts):
+            return None
+        return f"v{version}"
 
     @classmethod
     def _apply_staged_version(cls, static_dir: str, bsl_dir: str) -> str | None:
@@ -450,63 +1150,55 @@ class BslLanguageServer(SolidLanguageServer):
 
         """
         staged_dir = os.path.join(bsl_dir, STAGED_DIR_NAME)
-        lock_file = os.path.join(static_dir, LOCK_FILENAME)
-
-        if not os.path.exists(staged_dir):
-            return None
 
-        staged_jars = [f for f in os.listdir(staged_dir) if f.endswith("-exec.jar")]
-        if not staged_jars:
+        # Fast path (checked without taking the lock): no staged directory or no staged JAR in it
+        staged_jar = cls._find_exec_jar(staged_dir)
+        if staged_jar is None:
             return None
 
-        staged_jar_name = staged_jars[0]
-        staged_jar_path = os.path.join(staged_dir, staged_jar_name)
+        staged_jar_name = staged_jar.name
+        staged_jar_path = staged_jar.path
 
         # Use file locking for safe concurrent access
         try:
-            with open(lock_file, "w") as lock_fd:
-                if not _lock_file(lock_fd):
+            with _update_lock(static_dir) as acquired:
+                if not acquired:
                     log.warning("Could not acquire lock for applying staged version - another process may be updating")
                     return None
-                try:
-                    # Find and remove existing JARs in main directory
-                    existing_jars = [f for f in os.listdir(bsl_dir) if f.endswith("-exec.jar")]
-                    for old_jar in existing_jars:
-                        old_jar_path = os.path.join(bsl_dir, old_jar)
-                        try:
-                            os.remove(old_jar_path)
-                            log.info(f"Removed old BSL Language Server JAR: {old_jar}")
-                        except OSError as e:
-                            log.warning(f"Failed to remove old JAR {old_jar}: {e}")
-
-                    # Move staged JAR to main directory
-                    target_jar_path = os.path.join(bsl_dir, staged_jar_name)
-                    shutil.move(staged_jar_path, target_jar_path)
-
-                    # Update version info
-                    version_info = cls._read_version_info(static_dir)
-                    staged_version = cls._extract_version_from_jar_name(staged_jar_name)
-                    version_info.current = staged_version
-                    version_info.staged = None
-                    cls._write_version_info(static_dir, version_info)
-
-                    log.info(f"Applied staged BSL Language Server version: {staged_version}")
 
-                    # Clean up staged directory
+                # Find and remove existing JARs in main directory (a JAR with the staged name is replaced atomically below)
+                with os.scandir(bsl_dir) as entries:
+                    existing_jars = [
+                        entry for entry in entries if cls._is_exec_jar(entry.name) and entry.name != staged_jar_name and entry.is_file()
+                    ]
+                for old_jar in existing_jars:
                     try:
-                        shutil.rmtree(staged_dir)
-                    except OSError:
-                        pass
+                        os.remove(old_jar.path)
+                        log.info(f"Removed old BSL Language Server JAR: {old_jar.name}")
+                    except OSError as e:
+                        log.warning(f"Failed to remove old JAR {old_jar.name}: {e}")
+
+                # Move staged JAR to main directory (same file system, so this is a single atomic rename)
+                target_jar_path = os.path.join(bsl_dir, staged_jar_name)
+                os.replace(staged_jar_path, target_jar_path)
+
+                # Update version info
+                staged_version = cls._extract_version_from_jar_name(staged_jar_name)
+                version_info = dataclasses.replace(cls._read_version_info(static_dir), current=staged_version, staged=None)
+                cls._write_version_info(static_dir, version_info)
+
+                log.info(f"Applied staged BSL Language Server version: {staged_version}")
+
+                # Clean up staged directory
+                shutil.rmtree(staged_dir, ignore_errors=True)
 
-                    return target_jar_path
-                finally:
-                    _unlock_file(lock_fd)
+                return target_jar_path
         except OSError as e:
             log.warning(f"Failed to apply staged version: {e}")
             return None
 
     @classmethod
-    def _get_pinned_or_latest_version(cls, solidlsp_settings: SolidLSPSettings, static_dir: str) -> tuple[str | None, str | None, bool]:
+    def _get_pinned_or_latest_version(cls, solidlsp_settings: SolidLSPSettings, static_dir: str) -> tuple[BslReleaseAsset | None, bool]:
         """
         Determine the target version based on pinning configuration.
 
@@ -515,9 +1207,8 @@ class BslLanguageServer(SolidLanguageServer):
             static_dir: Path to the BSL Language Server static directory
 
         Returns:
-            Tuple of (download_url, version, is_pinned):
-            - download_url: URL to download the JAR from, or None if using existing
-            - version: Target version string
+            Tuple of (release_asset, is_pinned):
+            - release_asset: The JAR asset of the target version, or None if it could not be determined
             - is_pinned: True if version is pinned (skip auto-updates)
 
         """
@@ -528,24 +1219,18 @@ class BslLanguageServer(SolidLanguageServer):
             # Version is pinned - try to get the specific version
             log.info(f"BSL Language Server version pinned to: {pinned_version}")
 
-            # Update version info with pinned setting
-            version_info = cls._read_version_info(static_dir)
-            version_info.pinned = pinned_version
-            cls._write_version_info(static_dir, version_info)
-
-            result = cls._get_release_url_for_version(pinned_version)
-            if result:
-                return result[0], result[1], True
+            release_asset = cls._get_release_url_for_version(pinned_version, static_dir)
+            if release_asset:
+                return release_asset, True
             else:
                 log.warning(f"Pinned version {pinned_version} not found, falling back to latest")
 
         # Get latest version
         try:
-            download_url, version = cls._get_latest_bsl_release_url()
-            return download_url, version, pinned_version is not None
+            return cls._get_latest_bsl_release_url(static_dir), pinned_version is not None
         except Exception as e:
             log.warning(f"Failed to get latest BSL Language Server release: {e}")
-            return None, None, pinned_version is not None
+            return None, pinned_version is not None
 
     @classmethod
     def _should_check_for_updates(cls, version_info: VersionInfo) -> bool:
@@ -565,26 +1250,24 @@ class BslLanguageServer(SolidLanguageServer):
         if not version_info.last_check:
             return True
 
-        try:
-            last_check = datetime.fromisoformat(version_info.last_check.replace("Z", "+00:00"))
-            now = datetime.now(UTC)
-            elapsed = (now - last_check).total_seconds()
-            return elapsed >= UPDATE_CHECK_INTERVAL_SECONDS
-        except (ValueError, TypeError):
-            return True
+        return int(time.time()) - version_info.last_check >= UPDATE_CHECK_INTERVAL_SECONDS
 
     @classmethod
-    def _start_background_update_check(cls, current_version: str | None, static_dir: str, bsl_dir: str) -> None:
+    def _start_background_update_check(
+        cls, current_version: str | None, static_dir: str, bsl_dir: str, version_info: VersionInfo | None = None
+    ) -> None:
         """
-        Start a background thread to check for and download updates.
+        Start a background thread to check for and download updates, unless no check is due.
 
         Args:
             current_version: Currently installed version
             static_dir: Path to the BSL Language Server static directory
             bsl_dir: Path to the bsl-ls directory containing JAR files
+            version_info: Version info already read by the caller, or None to read it from version.json
 
         """
-        version_info = cls._read_version_info(static_dir)
+        if version_info is None:
+            version_info = cls._read_version_info(static_dir)
 
         if not cls._should_check_for_updates(version_info):
             log.debug("Skipping update check - not enough time since last check or version is pinned")
@@ -599,6 +1282,114 @@ class BslLanguageServer(SolidLanguageServer):
         thread.start()
         log.debug("Started background update check thread for BSL Language Server")
 
+    @classmethod
+    def _is_installed_jar_recent(cls, bsl_dir: str) -> bool:
+        """
+        Check whether the installed JAR was written less than UPDATE_CHECK_INTERVAL_SECONDS ago.
+
+        Args:
+            bsl_dir: Path to the bsl-ls directory containing JAR files
+
+        Returns:
+            True if the JAR recorded in the installed manifest is younger than the update check interval
+
+        """
+        installed = cls._read_installed_manifest(bsl_dir)
+        if installed is None:
+            return False
+        try:
+            return time.time() - os.path.getmtime(installed[0]) < UPDATE_CHECK_INTERVAL_SECONDS
+        except OSError:
+            return False
+
+    @classmethod
+    def _record_update_check(cls, static_dir: str) -> None:
+        """
+        Set the last update check time in version.json to now (inside lock for thread safety).
+
+        Args:
+            static_dir: Path to the BSL Language Server static directory
+
+        """
+        with _update_lock(static_dir) as acquired:
+            if acquired:
+                version_info = cls._read_version_info(static_dir)
+                cls._write_version_info(static_dir, dataclasses.replace(version_info, last_check=int(time.time())))
+
+    @classmethod
+    def _publish_staged_update(
+        cls,
+        static_dir: str,
+        staged_dir: str,
+        staged_version: str,
+        temp_jar_path: str | None = None,
+        staged_jar_path: str | None = None,
+    ) -> bool:
+        """
+        Under the update lock, move a downloaded JAR into the staged directory and record the staged version
+        together with the last update check time in version.json.
+
+        The downloaded JAR is flushed to disk here (once, right before it is published). If another process has
+        staged or installed the same version while it was being downloaded, the JAR is not published, and only
+        the last update check time is recorded.
+
+        Args:
+            static_dir: Path to the BSL Language Server static directory
+            staged_dir: Path to the staged directory
+            staged_version: Version of the staged JAR
+            temp_jar_path: Path to the downloaded JAR to move into place, or None if it is already staged
+            staged_jar_path: Target path of the staged JAR (required if temp_jar_path is given)
+
+        Returns:
+            True if the update was published, False if the lock could not be acquired or another process has
+            already staged or installed the version
+
+        """
+        with _update_lock(static_dir) as acquired:
+            if not acquired:
+                log.warning("Could not acquire lock for staging update - another process may be updating")
+                return False
+
+            # Read version info once inside the lock; last check time and staged version are written back together
+            version_info = cls._read_version_info(static_dir)
+
+            if temp_jar_path is not None and staged_jar_path is not None:
+                # Re-check under the lock: another process may have staged or installed this version in the meantime
+                staged_normalized = staged_version.lstrip("v")
+                installed = cls._read_installed_manifest(os.path.dirname(staged_dir))
+                installed_version = installed[1] if installed is not None else None
+                already_staged = (version_info.staged or "").lstrip("v") == staged_normalized and os.path.isfile(staged_jar_path)
+                if already_staged or (installed_version or "").lstrip("v") == staged_normalized:
+                    log.info(f"BSL Language Server {staged_version} was already staged or installed by another process")
+                    cls._write_version_info(static_dir, dataclasses.replace(version_info, last_check=int(time.time())))
+                    return False
+
+                # Clean up temp files left behind by interrupted downloads (other processes' downloads in
+                # progress are recent and therefore kept)
+                stale_before = time.time() - UPDATE_CHECK_INTERVAL_SECONDS
+                with os.scandir(staged_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith((".tmp", ".download")) and entry.path != temp_jar_path:
+                            try:
+                                if entry.stat().st_mtime < stale_before:
+                                    os.remove(entry.path)
+                            except OSError:
+                                pass
+
+                # Flush the JAR and then the rename to disk before version.json refers to the staged JAR
+                with open(temp_jar_path, "rb+") as jar_file:
+                    os.fsync(jar_file.fileno())
+                os.replace(temp_jar_path, staged_jar_path)
+                if os.name == "posix":
+                    directory_fd = os.open(staged_dir, os.O_RDONLY)
+                    try:
+                        os.fsync(directory_fd)
+                    finally:
+                        os.close(directory_fd)
+
+            cls._write_version_info(static_dir, dataclasses.replace(version_info, last_check=int(time.time()), staged=staged_version))
+            return True
+
     @classmethod
     def _check_and_download_update(cls, current_version: str | None, static_dir: str, bsl_dir: str) -> None:
         """
@@ -613,11 +1404,16 @@ class BslLanguageServer(SolidLanguageServer):
             bsl_dir: Path to the bsl-ls directory containing JAR files
 
         """
-        lock_file = os.path.join(static_dir, LOCK_FILENAME)
-
         try:
+            # A JAR installed within the check interval (e.g. just downloaded on first install) is considered current
+            if current_version and cls._is_installed_jar_recent(bsl_dir):
+                log.debug(f"BSL Language Server {current_version} was installed recently - skipping update check")
+                cls._record_update_check(static_dir)
+                return
+
             # Get latest version info first (outside lock - read-only operation)
-            download_url, latest_version = cls._get_latest_bsl_release_url()
+            release_asset = cls._get_latest_bsl_release_url(static_dir)
+            latest_version = release_asset.version
 
             # Normalize versions for comparison
             current_normalized = current_version.lstrip("v") if current_version else None
@@ -625,72 +1421,69 @@ class BslLanguageServer(SolidLanguageServer):
 
             if current_normalized == latest_normalized:
                 log.debug(f"BSL Language Server is up to date: {current_version}")
-                # Update last_check even when up to date (inside lock for thread safety)
-                with open(lock_file, "w") as lock_fd:
-                    if _lock_file(lock_fd):
-                        try:
-                            version_info = cls._read_version_info(static_dir)
-                            version_info.last_check = datetime.now(UTC).isoformat()
-                            cls._write_version_info(static_dir, version_info)
-                        finally:
-                            _unlock_file(lock_fd)
+                # Update last_check even when up to date
+                cls._record_update_check(static_dir)
                 return
 
             log.info(f"New BSL Language Server version available: {latest_version} (current: {current_version})")
 
-            # Acquire lock for staged operations and version info updates
-            with open(lock_file, "w") as lock_fd:
-                if not _lock_file(lock_fd):
-                    log.warning("Could not acquire lock for update download - another process may be updating")
-                    return
-
-                try:
-                    # Update last check time (inside lock for thread safety)
-                    version_info = cls._read_version_info(static_dir)
-                    version_info.last_check = datetime.now(UTC).isoformat()
-                    cls._write_version_info(static_dir, version_info)
-
-                    # Create staged directory
-                    staged_dir = os.path.join(bsl_dir, STAGED_DIR_NAME)
-                    os.makedirs(staged_dir, exist_ok=True)
-
-                    # Clean up any stale .tmp files from previous interrupted downloads
-                    for f in os.listdir(staged_dir):
-                        if f.endswith(".tmp"):
-                            try:
-                                os.remove(os.path.join(staged_dir, f))
-                            except OSError:
-                                pass
+            staged_dir = os.path.join(bsl_dir, STAGED_DIR_NAME)
+            jar_name = os.path.basename(release_asset.download_url)
+            staged_jar_path = os.path.join(staged_dir, jar_name)
 
-                    # Download to temp file first, then rename
-                    jar_name = os.path.basename(download_url)
-                    staged_jar_path = os.path.join(staged_dir, jar_name)
-                    temp_jar_path = staged_jar_path + ".tmp"
+            # The latest version was already staged by an earlier check and is waiting for the next startup
+            staged_version = cls._read_version_info(static_dir).staged
+            staged_normalized = staged_version.lstrip("v") if staged_version else None
+            if staged_normalized == latest_normalized and os.path.isfile(staged_jar_path):
+                log.debug(f"BSL Language Server {latest_version} is already staged for next startup")
+                cls._record_update_check(static_dir)
+                return
 
-                    log.info(f"Downloading BSL Language Server {latest_version} to staged directory...")
-                    FileUtils.download_and_extract_archive(download_url, temp_jar_path, "binary")
+            os.makedirs(staged_dir, exist_ok=True)
 
-                    # Verify download succeeded (check file exists and has reasonable size)
-                    # BSL LS JAR is typically ~60MB, but we use 1MB as minimum to catch clearly corrupt files
-                    min_jar_size = 1024 * 1024  # 1MB minimum
-                    if os.path.exists(temp_jar_path) and os.path.getsize(temp_jar_path) > min_jar_size:
-                        # Rename from .tmp to final name
-                        shutil.move(temp_jar_path, staged_jar_path)
+            # Skip the download if this release was already staged completely (e.g. by another process)
+            if cls._is_download_complete(staged_jar_path, release_asset.size, release_asset.sha256):
+                log.info(f"BSL Language Server {latest_version} is already staged for next startup")
+                cls._publish_staged_update(static_dir, staged_dir, latest_version)
+                return
 
-                        # Update version info with staged version
-                        version_info = cls._read_version_info(static_dir)
-                        version_info.staged = latest_version
-                        cls._write_version_info(static_dir, version_info)
+            # Fail fast on an asset whose advertised size is clearly too small, before transferring anything
+            if release_asset.size is not None and release_asset.size <= _MIN_JAR_SIZE:
+                log.warning(f"BSL Language Server {latest_version} JAR is too small ({release_asset.size} bytes) - skipping update")
+                cls._record_update_check(static_dir)
+                return
 
+            # Download to a uniquely named temp file without holding the lock, so that other processes (and other
+            # instances in this process) are not blocked for the duration of the transfer; the lock is only taken to
+            # publish the result. The download is not flushed to disk here: _publish_staged_update does that once.
+            temp_jar_path = f"{staged_jar_path}.{uuid.uuid4().hex}.tmp"
+            try:
+                log.info(f"Downloading BSL Language Server {latest_version} to staged directory...")
+                FileUtils.download_file_verified(
+                    release_asset.download_url, temp_jar_path, expected_sha256=release_asset.sha256, session=_HTTP_SESSION
+                )
+
+                # Verify download succeeded: the size must match the advertised asset size if known,
+                # otherwise it must at least be plausible
+                if release_asset.size is not None:
+                    download_ok = cls._is_download_complete(temp_jar_path, release_asset.size)
+                else:
+                    download_ok = os.path.exists(temp_jar_path) and os.path.getsize(temp_jar_path) > _MIN_JAR_SIZE
+                if download_ok:
+                    if cls._publish_staged_update(static_dir, staged_dir, latest_version, temp_jar_path, staged_jar_path):
                         log.info(f"BSL Language Server {latest_version} downloaded and staged for next startup")
-                    else:
-                        log.warning("Downloaded JAR file appears to be corrupted or too small")
-                        if os.path.exists(temp_jar_path):
-                            os.remove(temp_jar_path)
-                finally:
-                    _unlock_file(lock_fd)
-
-        except urllib.error.URLError as e:
+                else:
+                    log.warning("Downloaded JAR file appears to be corrupted or incomplete")
+                    cls._record_update_check(static_dir)
+            except Exception:
+                # Record the attempt anyway, so that a failing download is not retried on every startup
+                cls._record_update_check(static_dir)
+                raise
+            finally:
+                if os.path.exists(temp_jar_path):
+                    os.remove(temp_jar_path)
+
+        except requests.RequestException as e:
             log.warning(f"Update check failed - GitHub not accessible: {e}")
         except Exception as e:
             log.warning(f"Update check failed: {e}")
@@ -700,107 +1493,159 @@ class BslLanguageServer(SolidLanguageServer):
         """
         Setup runtime dependencies for BSL Language Server and return the paths.
         """
-        platform_id = PlatformUtils.get_platform_id()
-
-        # Java runtime dependencies (same as Kotlin Language Server)
-        java_dependencies = {
-            "win-x64": {
-                "url": "https://github.com/redhat-developer/vscode-java/releases/download/v1.42.0/java-win32-x64-1.42.0-561.vsix",
-                "archiveType": "zip",
-                "java_home_path": "extension/jre/21.0.7-win32-x86_64",
-                "java_path": "extension/jre/21.0.7-win32-x86_64/bin/java.exe",
-            },
-            "linux-x64": {
-                "url": "https://github.com/redhat-developer/vscode-java/releases/download/v1.42.0/java-linux-x64-1.42.0-561.vsix",
-                "archiveType": "zip",
-                "java_home_path": "extension/jre/21.0.7-linux-x86_64",
-                "java_path": "extension/jre/21.0.7-linux-x86_64/bin/java",
-            },
-            "linux-arm64": {
-                "url": "https://github.com/redhat-developer/vscode-java/releases/download/v1.42.0/java-linux-arm64-1.42.0-561.vsix",
-                "archiveType": "zip",
-                "java_home_path": "extension/jre/21.0.7-linux-aarch64",
-                "java_path": "extension/jre/21.0.7-linux-aarch64/bin/java",
-            },
-            "osx-x64": {
-                "url": "https://github.com/redhat-developer/vscode-java/releases/download/v1.42.0/java-darwin-x64-1.42.0-561.vsix",
-                "archiveType": "zip",
-                "java_home_path": "extension/jre/21.0.7-macosx-x86_64",
-                "java_path": "extension/jre/21.0.7-macosx-x86_64/bin/java",
-            },
-            "osx-arm64": {
-                "url": "https://github.com/redhat-developer/vscode-java/releases/download/v1.42.0/java-darwin-arm64-1.42.0-561.vsix",
-                "archiveType": "zip",
-                "java_home_path": "extension/jre/21.0.7-macosx-aarch64",
-                "java_path": "extension/jre/21.0.7-macosx-aarch64/bin/java",
-            },
-        }
+        platform_id = _get_platform_id()
 
         # Verify platform support
-        if platform_id.value not in java_dependencies:
+        java_dependency = _JAVA_DEPENDENCIES.get(platform_id.value)
+        if java_dependency is None:
             raise RuntimeError(f"Platform {platform_id.value} is not supported for BSL Language Server")
 
-        java_dependency = java_dependencies[platform_id.value]
-
         # Setup paths for dependencies
         static_dir = os.path.join(cls.ls_resources_dir(solidlsp_settings), "bsl_language_server")
-        os.makedirs(static_dir, exist_ok=True)
 
         # Setup Java paths
         java_dir = os.path.join(static_dir, "java")
-        os.makedirs(java_dir, exist_ok=True)
-
         java_home_path = os.path.join(java_dir, java_dependency["java_home_path"])
         java_path = os.path.join(java_dir, java_dependency["java_path"])
 
-        # Download and extract Java if not exists
-        if not os.path.exists(java_path):
-            log.info(f"Downloading Java for {platform_id.value}...")
-            FileUtils.download_and_extract_archive(java_dependency["url"], java_dir, java_dependency["archiveType"])
-            # Make Java executable
-            if not platform_id.value.startswith("win-"):
-                os.chmod(java_path, stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
+        # Setup BSL Language Server directory
+        bsl_dir = os.path.join(static_dir, "bsl-ls")
+
+        # Create the directories (and static_dir as their parent) unless a previous run already did
+        for directory in (java_dir, bsl_dir):
+            if not os.path.isdir(directory):
+                os.makedirs(directory, exist_ok=True)
+
+        # Read version.json once; the JAR setup returns the version info as updated by it
+        version_info = cls._read_version_info(static_dir)
+
+        if os.path.exists(java_path):
+            bsl_jar_path, current_version, version_info = cls._setup_bsl_jar(solidlsp_settings, static_dir, bsl_dir, version_info)
+        else:
+            # Java and the BSL LS JAR are independent downloads, so fetch them concurrently on first install
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="BSL-LS-Setup") as executor:
+                java_future = executor.submit(cls._download_java, platform_id, java_dependency, java_dir, java_path)
+                jar_future = executor.submit(cls._setup_bsl_jar, solidlsp_settings, static_dir, bsl_dir, version_info)
+                java_future.result()
+                bsl_jar_path, current_version, version_info = jar_future.result()
 
         assert os.path.exists(java_path), f"Java executable not found at {java_path}"
+        cls._ensure_executable(java_path)
 
-        # Setup BSL Language Server JAR
-        bsl_dir = os.path.join(static_dir, "bsl-ls")
-        os.makedirs(bsl_dir, exist_ok=True)
+        # Background update check (if not pinned); started by _start_server, so that it overlaps with the JVM startup
+        pending_update_check = None
+        if not version_info.pinned and not solidlsp_settings.get_ls_specific_settings(Language.BSL).get("version"):
+            pending_update_check = functools.partial(cls._start_background_update_check, current_version, static_dir, bsl_dir, version_info)
+
+        return BslRuntimeDependencyPaths(
+            java_path=java_path,
+            java_home_path=java_home_path,
+            bsl_jar_path=bsl_jar_path,
+            pending_update_check=pending_update_check,
+        )
 
+    @staticmethod
+    def _download_java(platform_id: PlatformId, java_dependency: dict[str, str], java_dir: str, java_path: str) -> None:
+        """
+        Download and extract the Java runtime for the given platform.
+
+        Args:
+            platform_id: The current platform
+            java_dependency: Java runtime dependency description for the platform
+            java_dir: Directory to extract the Java runtime to
+            java_path: Path of the Java executable within the extracted runtime
+
+        """
+        log.info(f"Downloading Java for {platform_id.value}...")
+        FileUtils.download_and_extract_archive(java_dependency["url"], java_dir, java_dependency["archiveType"], session=_HTTP_SESSION)
+
+    @staticmethod
+    def _ensure_executable(path: str) -> None:
+        """
+        Make the file executable by everyone, unless it already is (avoids a redundant chmod).
+
+        Args:
+            path: Path to the file
+
+        """
+        mode = os.stat(path).st_mode
+        if mode & 0o111 != 0o111:
+            os.chmod(path, mode | 0o755)
+
+    @classmethod
+    def _setup_bsl_jar(
+        cls, solidlsp_settings: SolidLSPSettings, static_dir: str, bsl_dir: str, version_info: VersionInfo
+    ) -> tuple[str, str | None, VersionInfo]:
+        """
+        Locate the BSL Language Server JAR, applying a staged update or downloading it if necessary.
+
+        Args:
+            solidlsp_settings: The SolidLSP settings object
+            static_dir: Path to the BSL Language Server static directory
+            bsl_dir: Path to the bsl-ls directory containing JAR files
+            version_info: Version info read at startup
+
+        Returns:
+            Tuple of (bsl_jar_path, current_version, version_info), where version_info reflects the changes written
+            to version.json (if any)
+
+        """
         # Step 1: Apply staged version if exists (from previous background download)
         staged_jar_path = cls._apply_staged_version(static_dir, bsl_dir)
         if staged_jar_path:
             bsl_jar_path = staged_jar_path
             current_version = cls._extract_version_from_jar_name(os.path.basename(bsl_jar_path))
+            cls._write_installed_manifest(bsl_dir, bsl_jar_path, current_version)
+            # _apply_staged_version has already written this to version.json
+            version_info = dataclasses.replace(version_info, current=current_version, staged=None)
         else:
-            # Step 2: Check if JAR already exists
-            existing_jars = [f for f in os.listdir(bsl_dir) if f.endswith("-exec.jar")] if os.path.exists(bsl_dir) else []
-
-            if existing_jars:
-                bsl_jar_path = os.path.join(bsl_dir, existing_jars[0])
-                current_version = cls._extract_version_from_jar_name(existing_jars[0])
+            # Step 2: Check if JAR already exists (recorded in the manifest, or found by scanning the directory)
+            installed = cls._read_installed_manifest(bsl_dir)
+            if installed is None:
+                existing_jar = cls._find_exec_jar(bsl_dir)
+                if existing_jar is not None:
+                    installed = (existing_jar.path, cls._extract_version_from_jar_name(existing_jar.name))
+                    cls._write_installed_manifest(bsl_dir, *installed)
+
+            if installed is not None and not cls._is_viable_jar(installed[0]):
+                log.warning(f"Existing BSL Language Server JAR is corrupt, downloading it again: {installed[0]}")
+                with contextlib.suppress(OSError):
+                    os.remove(installed[0])
+                installed = None
+
+            if installed is not None:
+                bsl_jar_path, current_version = installed
                 log.info(f"Using existing BSL Language Server JAR: {bsl_jar_path}")
 
                 # Update version info if not set
-                version_info = cls._read_version_info(static_dir)
                 if not version_info.current:
-                    version_info.current = current_version
+                    version_info = dataclasses.replace(version_info, current=current_version)
                     cls._write_version_info(static_dir, version_info)
             else:
                 # Step 3: Download version (pinned or latest)
-                download_url, version, is_pinned = cls._get_pinned_or_latest_version(solidlsp_settings, static_dir)
+                release_asset, is_pinned = cls._get_pinned_or_latest_version(solidlsp_settings, static_dir)
 
-                if download_url:
-                    jar_name = os.path.basename(download_url)
+                if release_asset and release_asset.download_url:
+                    version = release_asset.version
+                    jar_name = os.path.basename(release_asset.download_url)
                     bsl_jar_path = os.path.join(bsl_dir, jar_name)
 
                     log.info(f"Downloading BSL Language Server {version}...")
-                    FileUtils.download_and_extract_archive(download_url, bsl_jar_path, "binary")
-
-                    # Update version info
-                    version_info = cls._read_version_info(static_dir)
-                    version_info.current = version
-                    cls._write_version_info(static_dir, version_info)
+                    FileUtils.download_file_verified(
+                        release_asset.download_url,
+                        bsl_jar_path,
+                        expected_sha256=release_asset.sha256,
+                        session=_HTTP_SESSION,
+                        fsync=True,
+                    )
+                    cls._write_installed_manifest(bsl_dir, bsl_jar_path, version)
+
+                    # Update version info (recording the pinned version, if any)
+                    pinned_version = solidlsp_settings.get_ls_specific_settings(Language.BSL).get("version") or version_info.pinned
+                    updated_version_info = dataclasses.replace(version_info, current=version, pinned=pinned_version)
+                    if updated_version_info != version_info:
+                        version_info = updated_version_info
+                        cls._write_version_info(static_dir, version_info)
 
                     current_version = version
                 else:
@@ -808,17 +1653,7 @@ class BslLanguageServer(SolidLanguageServer):
                     raise RuntimeError("Cannot download BSL Language Server: no network access and no cached version")
 
         assert os.path.exists(bsl_jar_path), f"BSL Language Server JAR not found at {bsl_jar_path}"
-
-        # Step 4: Start background update check (if not pinned)
-        version_info = cls._read_version_info(static_dir)
-        if not version_info.pinned:
-            cls._start_background_update_check(current_version, static_dir, bsl_dir)
-
-        return BslRuntimeDependencyPaths(
-            java_path=java_path,
-            java_home_path=java_home_path,
-            bsl_jar_path=bsl_jar_path,
-        )
+        return bsl_jar_path, current_version, version_info
 
     @staticmethod
     def _get_initialize_params(repository_absolute_path: str) -> InitializeParams:
@@ -828,166 +1663,29 @@ class BslLanguageServer(SolidLanguageServer):
         if not os.path.isabs(repository_absolute_path):
             repository_absolute_path = os.path.abspath(repository_absolute_path)
 
-        root_uri = pathlib.Path(repository_absolute_path).as_uri()
-        initialize_params = {
-            "clientInfo": {"name": "Serena BSL Client", "version": "1.0.0"},
-            "locale": "ru",
-            "rootPath": repository_absolute_path,
-            "rootUri": root_uri,
-            "capabilities": {
-                "workspace": {
-                    "applyEdit": True,
-                    "workspaceEdit": {
-                        "documentChanges": True,
-                        "resourceOperations": ["create", "rename", "delete"],
-                        "failureHandling": "textOnlyTransactional",
-                        "normalizesLineEndings": True,
-                    },
-                    "didChangeConfiguration": {"dynamicRegistration": True},
-                    "didChangeWatchedFiles": {"dynamicRegistration": True, "relativePatternSupport": True},
-                    "symbol": {
-                        "dynamicRegistration": True,
-                        "symbolKind": {"valueSet": list(range(1, 27))},
-                        "tagSupport": {"valueSet": [1]},
-                    },
-                    "codeLens": {"refreshSupport": True},
-                    "executeCommand": {"dynamicRegistration": True},
-                    "configuration": True,
-                    "workspaceFolders": True,
-                    "diagnostics": {"refreshSupport": True},
-                },
-                "textDocument": {
-                    "publishDiagnostics": {
-                        "relatedInformation": True,
-                        "versionSupport": False,
-                        "tagSupport": {"valueSet": [1, 2]},
-                        "codeDescriptionSupport": True,
-                        "dataSupport": True,
-                    },
-                    "synchronization": {"dynamicRegistration": True, "willSave": True, "willSaveWaitUntil": True, "didSave": True},
-                    "completion": {
-                        "dynamicRegistration": True,
-                        "contextSupport": True,
-                        "completionItem": {
-                            "snippetSupport": False,
-                            "commitCharactersSupport": True,
-                            "documentationFormat": ["markdown", "plaintext"],
-                            "deprecatedSupport": True,
-                            "preselectSupport": True,
-                            "tagSupport": {"valueSet": [1]},
-                            "insertReplaceSupport": False,
-                            "resolveSupport": {"properties": ["documentation", "detail", "additionalTextEdits"]},
-                            "insertTextModeSupport": {"valueSet": [1, 2]},
-                            "labelDetailsSupport": True,
-                        },
-                        "insertTextMode": 2,
-                        "completionItemKind": {
-                            "valueSet": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25]
-                        },
-                    },
-                    "hover": {"dynamicRegistration": True, "contentFormat": ["markdown", "plaintext"]},
-                    "signatureHelp": {
-                        "dynamicRegistration": True,
-                        "signatureInformation": {
-                            "documentationFormat": ["markdown", "plaintext"],
-                            "parameterInformation": {"labelOffsetSupport": True},
-                            "activeParameterSupport": True,
-                        },
-                        "contextSupport": True,
-                    },
-                    "definition": {"dynamicRegistration": True, "linkSupport": True},
-                    "references": {"dynamicRegistration": True},
-                    "documentHighlight": {"dynamicRegistration": True},
-                    "documentSymbol": {
-                        "dynamicRegistration": True,
-                        "symbolKind": {"valueSet": list(range(1, 27))},
-                        "hierarchicalDocumentSymbolSupport": True,
-                        "tagSupport": {"valueSet": [1]},
-                        "labelSupport": True,
-                    },
-                    "codeAction": {
-                        "dynamicRegistration": True,
-                        "isPreferredSupport": True,
-                        "disabledSupport": True,
-                        "dataSupport": True,
-                        "resolveSupport": {"properties": ["edit"]},
-                        "codeActionLiteralSupport": {
-                            "codeActionKind": {
-                                "valueSet": [
-                                    "",
-                                    "quickfix",
-                                    "refactor",
-                                    "refactor.extract",
-                                    "refactor.inline",
-                                    "refactor.rewrite",
-                                    "source",
-                                    "source.organizeImports",
-                                ]
-                            }
-                        },
-                        "honorsChangeAnnotations": False,
-                    },
-                    "codeLens": {"dynamicRegistration": True},
-                    "formatting": {"dynamicRegistration": True},
-                    "rangeFormatting": {"dynamicRegistration": True},
-                    "rename": {
-                        "dynamicRegistration": True,
-                        "prepareSupport": True,
-                        "prepareSupportDefaultBehavior": 1,
-                        "honorsChangeAnnotations": True,
-                    },
-                    "documentLink": {"dynamicRegistration": True, "tooltipSupport": True},
-                    "foldingRange": {
-                        "dynamicRegistration": True,
-                        "rangeLimit": 5000,
-                        "lineFoldingOnly": True,
-                        "foldingRangeKind": {"valueSet": ["comment", "imports", "region"]},
-                    },
-                    "callHierarchy": {"dynamicRegistration": True},
-                },
-                "window": {
-                    "showMessage": {"messageActionItem": {"additionalPropertiesSupport": True}},
-                    "showDocument": {"support": True},
-                    "workDoneProgress": True,
-                },
-                "general": {
-                    "staleRequestSupport": {"cancel": True, "retryOnContentModified": []},
-                    "regularExpressions": {"engine": "ECMAScript", "version": "ES2020"},
-                    "positionEncodings": ["utf-16"],
-                },
-            },
-            "initializationOptions": {
-                "workspaceFolders": [root_uri],
-            },
-            "trace": "verbose",
-            "processId": os.getpid(),
-            "workspaceFolders": [
-                {
-                    "uri": root_uri,
-                    "name": os.path.basename(repository_absolute_path),
-                }
-            ],
-        }
+        # shallow copy: top-level keys are fresh, nested structures are shared and must not be mutated
+        initialize_params = dict(_build_initialize_params(repository_absolute_path))
+        initialize_params["processId"] = os.getpid()
         return cast(InitializeParams, initialize_params)
 
     def _start_server(self) -> None:
         """
         Starts the BSL Language Server
         """
-
-        def do_nothing(params: dict) -> None:
-            return
-
-        def window_log_message(msg: dict) -> None:
-            log.info(f"LSP: window/logMessage: {msg}")
-
-        self.server.on_request("client/registerCapability", do_nothing)
-        self.server.on_notification("window/logMessage", window_log_message)
-        self.server.on_notification("$/progress", do_nothing)
-        self.server.on_notification("textDocument/publishDiagnostics", do_nothing)
+        self.server.on_request("client/registerCapability", _do_nothing)
+        self.server.on_notification("window/logMessage", _window_log_message)
+        self.server.on_notification("$/progress", _do_nothing)
+        self.server.on_notification("textDocument/publishDiagnostics", _do_nothing)
 
         log.info("Starting BSL Language Server process")
         self.server.start()
+
+        # Check for updates while the JVM starts up and the server initializes
+        pending_update_check = self.runtime_dependency_paths.pending_update_check
+        if pending_update_check is not None:
+            self.runtime_dependency_paths.pending_update_check = None
+            pending_update_check()
+
         initialize_params = self._get_initialize_params(self.repository_root_path)
 
         log.info("Sending initialize request from LSP client to LSP server and awaiting response")
@@ -216,9 +216,14 @@ class FileUtils:
         target_path: str,
         expected_sha256: str | None = None,
         allowed_hosts: tuple[str, ...] | list[str] | None = None,
+        session: requests.Session | None = None,
+        fsync: bool = False,
     ) -> None:
         """
         Downloads a file from ``url`` to ``target_path`` with optional integrity and host validation.
+        If a ``session`` is given, it is used for the request so that pooled connections can be reused.
+        If ``fsync`` is set, the file and (on POSIX) its directory are flushed to disk around the final rename,
+        so that a crash cannot leave a truncated file under ``target_path``.
         """
         # validating the requested host
         FileUtils._validate_download_host(url, allowed_hosts)
@@ -229,7 +234,10 @@ class FileUtils:
         temp_file_path = str(PurePath(target_directory, f".{Path(target_path).name}.{uuid.uuid4().hex}.download"))
         response: requests.Response | None = None
         try:
-            response = requests.get(url, stream=True, timeout=60)
+            if session is not None:
+                response = session.get(url, stream=True, timeout=60)
+            else:
+                response = requests.get(url, stream=True, timeout=60)
             if response.status_code != 200:
                 log.error(f"Error downloading file '{url}': {response.status_code} {response.text}")
                 raise SolidLSPException("Error downloading file.")
@@ -240,10 +248,19 @@ class FileUtils:
                 for chunk in response.iter_content(chunk_size=1024 * 1024):
                     if chunk:
                         output_file.write(chunk)
+                if fsync:
+                    output_file.flush()
+                    os.fsync(output_file.fileno())
 
             FileUtils._verify_sha256_if_configured(temp_file_path, expected_sha256)
 
             os.replace(temp_file_path, target_path)
+            if fsync and os.name == "posix":
+                directory_fd = os.open(target_directory, os.O_RDONLY)
+                try:
+                    os.fsync(directory_fd)
+                finally:
+                    os.close(directory_fd)
         except Exception as exc:
             log.error(f"Error downloading file '{url}': {exc}")
             raise SolidLSPException("Error downloading file.") from None
@@ -254,11 +271,11 @@ class FileUtils:
                 Path.unlink(Path(temp_file_path))
 
     @staticmethod
-    def download_and_extract_archive(url: str, target_path: str, archive_type: str) -> None:
+    def download_and_extract_archive(url: str, target_path: str, archive_type: str, session: requests.Session | None = None) -> None:
         """
         Downloads the archive from the given URL having format {archive_type} and extracts it to the given {target_path}
         """
-        FileUtils.download_and_extract_archive_verified(url, target_path, archive_type)
+        FileUtils.download_and_extract_archive_verified(url, target_path, archive_type, session=session)
 
     @staticmethod
     def download_and_extract_archive_verified(
@@ -267,6 +284,7 @@ class FileUtils:
         archive_type: str,
         expected_sha256: str | None = None,
         allowed_hosts: tuple[str, ...] | list[str] | None = None,
+        session: requests.Session | None = None,
     ) -> None:
         """
         Downloads an archive from ``url`` and extracts it safely into ``target_path``.
@@ -278,7 +296,9 @@ class FileUtils:
             os.makedirs(os.path.dirname(tmp_file_name), exist_ok=True)
 
             # downloading the archive with optional verification
-            FileUtils.download_file_verified(url, tmp_file_name, expected_sha256=expected_sha256, allowed_hosts=allowed_hosts)
+            FileUtils.download_file_verified(
+                url, tmp_file_name, expected_sha256=expected_sha256, allowed_hosts=allowed_hosts, session=session
+            )
             tmp_files.append(tmp_file_name)
 
             # extracting the archive according to its format
@@ -326,7 +346,7 @@ class FileUtils:
         """
         sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as input_file:
-            for chunk in iter(lambda: input_file.read(8192), b""):
+            for chunk in iter(lambda: input_file.read(1024 * 1024), b""):
                 sha256_hash.update(chunk)
         return sha256_hash.hexdigest()
 
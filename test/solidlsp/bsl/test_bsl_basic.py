@@ -5,10 +5,75 @@ These tests validate the functionality of the language server APIs
 like request_document_symbols using the BSL test repository.
 """
 
+from collections.abc import Iterator
+from pathlib import Path
+
 import pytest
 
+from serena.config.serena_config import SerenaPaths
 from solidlsp import SolidLanguageServer
 from solidlsp.ls_config import Language
+from test.conftest import LanguageParamRequest, start_ls_context
+
+# BSL Language Server version used by the tests; pinning it makes runs reproducible and skips the background update check
+_PINNED_BSL_VERSION = "0.28.0"
+_PINNED_SOLIDLSP_DIR = Path(SerenaPaths().serena_user_home_dir) / "test_language_servers" / f"bsl-{_PINNED_BSL_VERSION}"
+
+# Functions/procedures expected in the test repository files (in Russian)
+_EXPECTED_MAIN_SYMBOLS = (
+    "ПриветствоватьПользователя",
+    "ОбработатьЭлементы",
+    "ИнициализироватьПеременные",
+    "Главная",
+)
+_EXPECTED_UTILS_FUNCTIONS = (
+    "ВВерхнийРегистр",
+    "ВНижнийРегистр",
+    "УбратьПробелы",
+    "ЭтоЧисло",
+    "ПроверитьEmail",
+    "ЗаписатьВЛог",
+    "СоздатьРезервнуюКопию",
+    "СодержитЭлемент",
+)
+_EXPECTED_MODEL_FUNCTIONS = (
+    "СоздатьПользователя",
+    "ВалидироватьПользователя",
+    "СоздатьЗаказ",
+    "ДобавитьТоварВЗаказ",
+    "СоздатьТовар",
+)
+
+
+def _count_expected_names(expected_names: tuple[str, ...], symbol_names: list[str], stop_at: int) -> int:
+    """Count the expected names occurring in any of the symbol names, stopping as soon as ``stop_at`` have been found."""
+    # Symbol names contain no newlines, so a match in the joined text cannot span two names
+    symbol_names_text = "\n".join(symbol_names)
+    found = 0
+    for expected in expected_names:
+        if expected in symbol_names_text:
+            found += 1
+            if found >= stop_at:
+                break
+    return found
+
+
+@pytest.fixture(scope="module")
+def language_server(request: LanguageParamRequest) -> Iterator[SolidLanguageServer]:
+    """
+    Overrides the shared fixture to start the BSL Language Server with a pinned version.
+
+    The server is installed into a solidlsp directory of its own for the pinned version, so that the pinned JAR is
+    always the one used and the pin is not recorded in the user's own BSL LS installation. The directory persists
+    across runs (and is cached in CI), so the Java runtime and the JAR are only downloaded once per pinned version.
+    """
+    assert request.param == Language.BSL
+    with start_ls_context(
+        Language.BSL,
+        ls_specific_settings={Language.BSL: {"version": _PINNED_BSL_VERSION}},
+        solidlsp_dir=_PINNED_SOLIDLSP_DIR,
+    ) as ls:
+        yield ls
 
 
 @pytest.mark.bsl
@@ -33,15 +98,8 @@ class TestBslLanguageServerBasics:
         # Note: BSL LS may report names in different formats depending on version
         assert len(all_symbols) > 0, "Should find symbols in Main.bsl"
 
-        # Check for expected functions/procedures (in Russian or transliterated)
-        expected_symbols = [
-            "ПриветствоватьПользователя",
-            "ОбработатьЭлементы",
-            "ИнициализироватьПеременные",
-            "Главная",
-        ]
-
-        found_expected = sum(1 for expected in expected_symbols if any(expected in name for name in symbol_names))
+        # Check for expected functions/procedures
+        found_expected = _count_expected_names(_EXPECTED_MAIN_SYMBOLS, symbol_names, stop_at=2)
         assert found_expected >= 2, f"Should find at least 2 expected functions. Found symbols: {symbol_names}"
 
     @pytest.mark.parametrize("language_server", [Language.BSL], indirect=True)
@@ -53,18 +111,7 @@ class TestBslLanguageServerBasics:
         symbol_names = [symbol["name"] for symbol in all_symbols]
 
         # Should detect functions from Utils.bsl
-        expected_functions = [
-            "ВВерхнийРегистр",
-            "ВНижнийРегистр",
-            "УбратьПробелы",
-            "ЭтоЧисло",
-            "ПроверитьEmail",
-            "ЗаписатьВЛог",
-            "СоздатьРезервнуюКопию",
-            "СодержитЭлемент",
-        ]
-
-        found_count = sum(1 for func in expected_functions if any(func in name for name in symbol_names))
+        found_count = _count_expected_names(_EXPECTED_UTILS_FUNCTIONS, symbol_names, stop_at=4)
         assert found_count >= 4, f"Should find at least 4 utility functions. Found symbols: {symbol_names}"
 
     @pytest.mark.parametrize("language_server", [Language.BSL], indirect=True)
@@ -76,15 +123,7 @@ class TestBslLanguageServerBasics:
         symbol_names = [symbol["name"] for symbol in all_symbols]
 
         # Should detect model-related functions
-        expected_functions = [
-            "СоздатьПользователя",
-            "ВалидироватьПользователя",
-            "СоздатьЗаказ",
-            "ДобавитьТоварВЗаказ",
-            "СоздатьТовар",
-        ]
-
-        found_count = sum(1 for func in expected_functions if any(func in name for name in symbol_names))
+        found_count = _count_expected_names(_EXPECTED_MODEL_FUNCTIONS, symbol_names, stop_at=3)
         assert found_count >= 3, f"Should find at least 3 model functions. Found symbols: {symbol_names}"
 
     @pytest.mark.parametrize("language_server", [Language.BSL], indirect=True)
@@ -95,16 +134,15 @@ class TestBslLanguageServerBasics:
         # Should have symbols from all files
         assert len(symbols) > 0, "Should find symbols in the project"
 
-        # Flatten all symbol names for checking
+        # Flatten all symbol names for checking (iteratively, so deep trees cannot hit the recursion limit)
         all_names = []
-
-        def collect_names(symbol_list):
-            for sym in symbol_list:
-                all_names.append(sym.get("name", ""))
-                if "children" in sym:
-                    collect_names(sym["children"])
-
-        collect_names(symbols)
+        stack = list(symbols)
+        while stack:
+            sym = stack.pop()
+            all_names.append(sym.get("name", ""))
+            children = sym.get("children")
+            if children:
+                stack.extend(children)
 
         # Should have multiple symbols from different files
         assert len(all_names) >= 5, f"Should find at least 5 symbols across all files. Found: {len(all_names)}"
@@ -7,23 +7,44 @@ requiring the full language server to be running. They test:
 - Memory setting extraction
 - Version parsing from JAR filenames
 - Staged version application
+- GitHub response caching
 
-Tests are designed to run offline without network access.
+Tests are designed to run offline without network access. Each test works in its own tmp_path and the
+caches of BslLanguageServer are process-local, so the tests can also be distributed with pytest-xdist (-n auto).
 """
 
+import dataclasses
+import hashlib
 import json
 import os
+import pathlib
+import sys
+import time
+import zipfile
+from collections.abc import Callable
 from typing import Any
+from unittest.mock import patch
 
 import pytest
+import requests
 
 from solidlsp.language_servers.bsl_language_server import (
+    _HTTP_SESSION,
     BSL_CONFIG_FILENAME,
     DEFAULT_BSL_MEMORY,
+    INSTALLED_MANIFEST_FILENAME,
+    LOCK_FILENAME,
+    RELEASE_CACHE_TTL_SECONDS,
     STAGED_DIR_NAME,
+    UPDATE_CHECK_INTERVAL_SECONDS,
     VERSION_FILENAME,
     BslLanguageServer,
+    BslReleaseAsset,
     VersionInfo,
+    _lock_file,
+    _path_to_file_uri,
+    _unlock_file,
+    _update_lock,
 )
 from solidlsp.ls_config import Language
 from solidlsp.settings import SolidLSPSettings
@@ -149,6 +170,52 @@ class TestGetMemorySetting:
         assert result == "2048"
 
 
+@pytest.mark.bsl
+class TestGetJvmArgs:
+    """Test _get_jvm_args() - memory flag and additional JVM options."""
+
+    def test_jvm_args_default(self) -> None:
+        """Test that only the default memory flag is used without settings."""
+        settings = SolidLSPSettings(ls_specific_settings={})
+
+        result = BslLanguageServer._get_jvm_args(settings)
+
+        assert result == [f"-Xmx{DEFAULT_BSL_MEMORY}"]
+
+    def test_jvm_args_additional_options(self) -> None:
+        """Test that -Xmx is taken from jvm_options and the remaining options are appended."""
+        settings = SolidLSPSettings(ls_specific_settings={Language.BSL: {"jvm_options": "-Xmx12G -XX:+UseG1GC -Dfile.encoding=UTF-8"}})
+
+        result = BslLanguageServer._get_jvm_args(settings)
+
+        assert result == ["-Xmx12G", "-XX:+UseG1GC", "-Dfile.encoding=UTF-8"]
+
+    def test_jvm_args_explicit_memory_overrides_xmx(self) -> None:
+        """Test that explicit memory wins and the -Xmx flag from jvm_options is dropped."""
+        settings = SolidLSPSettings(ls_specific_settings={Language.BSL: {"memory": "8G", "jvm_options": "-Xmx16G -XX:+UseG1GC"}})
+
+        result = BslLanguageServer._get_jvm_args(settings)
+
+        assert result == ["-Xmx8G", "-XX:+UseG1GC"]
+
+    def test_jvm_args_kilobyte_xmx(self) -> None:
+        """Test that an -Xmx flag with a kilobyte suffix is taken over completely (no stray suffix left as an option)."""
+        settings = SolidLSPSettings(ls_specific_settings={Language.BSL: {"jvm_options": "-Xmx4194304k -XX:+UseG1GC"}})
+
+        result = BslLanguageServer._get_jvm_args(settings)
+
+        assert result == ["-Xmx4194304k", "-XX:+UseG1GC"]
+
+    @pytest.mark.parametrize("xmx_option", ["-Xmx4Gfoo", "-Xmx٤G"])
+    def test_jvm_args_malformed_xmx_dropped(self, xmx_option: str) -> None:
+        """Test that a malformed (or non-ASCII) -Xmx flag is neither used as the memory setting nor passed through."""
+        settings = SolidLSPSettings(ls_specific_settings={Language.BSL: {"jvm_options": f"{xmx_option} -XX:+UseG1GC"}})
+
+        result = BslLanguageServer._get_jvm_args(settings)
+
+        assert result == [f"-Xmx{DEFAULT_BSL_MEMORY}", "-XX:+UseG1GC"]
+
+
 @pytest.mark.bsl
 class TestExtractVersionFromJarName:
     """Test _extract_version_from_jar_name() - version parsing from JAR filenames."""
@@ -161,33 +228,39 @@ class TestExtractVersionFromJarName:
 
         assert result == "v0.28.0"
 
-    def test_extract_version_different_version(self) -> None:
-        """Test version extraction with different version numbers."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("jar_name", "expected_version"),
+        [
             ("bsl-language-server-1.0.0-exec.jar", "v1.0.0"),
             ("bsl-language-server-0.1.0-exec.jar", "v0.1.0"),
             ("bsl-language-server-10.20.30-exec.jar", "v10.20.30"),
             ("bsl-language-server-0.0.1-exec.jar", "v0.0.1"),
-        ]
-
-        for jar_name, expected_version in test_cases:
-            result = BslLanguageServer._extract_version_from_jar_name(jar_name)
-            assert result == expected_version, f"Failed for {jar_name}"
+        ],
+    )
+    def test_extract_version_different_version(self, jar_name: str, expected_version: str) -> None:
+        """Test version extraction with different version numbers."""
+        assert BslLanguageServer._extract_version_from_jar_name(jar_name) == expected_version
 
-    def test_extract_version_invalid_format(self) -> None:
-        """Test that None is returned for invalid JAR filename format."""
-        invalid_names = [
+    @pytest.mark.parametrize(
+        "name",
+        [
             "bsl-language-server.jar",  # No version
             "some-other-jar-1.0.0.jar",  # Wrong prefix
             "bsl-language-server-0.28.0.jar",  # Missing -exec suffix
             "bsl-language-server-abc-exec.jar",  # Non-numeric version
+            "bsl-language-server-0.28.0.1-exec.jar",  # Too many version components
+            "bsl-language-server-0.28.0-exec.jar.bak",  # Trailing suffix after the JAR name
             "",  # Empty string
             "random-file.txt",  # Not a JAR
-        ]
-
-        for name in invalid_names:
-            result = BslLanguageServer._extract_version_from_jar_name(name)
-            assert result is None, f"Expected None for '{name}', got '{result}'"
+            "old-bsl-language-server-0.28.0-exec.jar",  # Text before the prefix
+            "bsl-language-server-0..28-exec.jar",  # Empty version component
+            "bsl-language-server-0.28.0 -exec.jar",  # Whitespace in the version
+            "bsl-language-server-٠.٢٨.٠-exec.jar",  # Non-ASCII digits
+        ],
+    )
+    def test_extract_version_invalid_format(self, name: str) -> None:
+        """Test that None is returned for invalid JAR filename format."""
+        assert BslLanguageServer._extract_version_from_jar_name(name) is None
 
     def test_extract_version_partial_match(self) -> None:
         """Test that only complete version format is matched."""
@@ -205,14 +278,14 @@ class TestVersionInfo:
 
     def test_version_info_to_dict(self) -> None:
         """Test VersionInfo serialization to dictionary."""
-        info = VersionInfo(current="v0.28.0", staged="v0.29.0", last_check="2024-01-15T12:00:00Z", pinned=None)
+        info = VersionInfo(current="v0.28.0", staged="v0.29.0", last_check=1705320000, pinned=None)
 
         result = info.to_dict()
 
         assert result == {
             "current": "v0.28.0",
             "staged": "v0.29.0",
-            "last_check": "2024-01-15T12:00:00Z",
+            "last_check": 1705320000,
             "pinned": None,
         }
 
@@ -221,7 +294,7 @@ class TestVersionInfo:
         data = {
             "current": "v0.28.0",
             "staged": None,
-            "last_check": "2024-01-15T12:00:00Z",
+            "last_check": 1705320000,
             "pinned": "v0.27.0",
         }
 
@@ -229,9 +302,20 @@ class TestVersionInfo:
 
         assert result.current == "v0.28.0"
         assert result.staged is None
-        assert result.last_check == "2024-01-15T12:00:00Z"
+        assert result.last_check == 1705320000
         assert result.pinned == "v0.27.0"
 
+    def test_version_info_from_dict_legacy_last_check(self) -> None:
+        """Test that ISO 8601 last check timestamps written by earlier versions are converted to Unix time."""
+        result = VersionInfo.from_dict({"last_check": "2024-01-15T12:00:00Z"})
+        assert result.last_check == 1705320000
+
+        result = VersionInfo.from_dict({"last_check": "2024-01-15T12:00:00+00:00"})
+        assert result.last_check == 1705320000
+
+        result = VersionInfo.from_dict({"last_check": "invalid-timestamp"})
+        assert result.last_check is None
+
     def test_version_info_from_dict_partial(self) -> None:
         """Test VersionInfo deserialization with missing fields."""
         data = {"current": "v0.28.0"}
@@ -253,6 +337,16 @@ class TestVersionInfo:
         assert info.pinned is None
 
 
+@pytest.fixture
+def staged_tree(tmp_path: Any) -> tuple[str, str, str]:
+    """Create the static, bsl-ls and staged directories used by the staged update tests."""
+    static_dir = tmp_path / "static"
+    staged_dir = tmp_path / "bsl-ls" / STAGED_DIR_NAME
+    static_dir.mkdir()
+    staged_dir.mkdir(parents=True)
+    return str(static_dir), str(staged_dir.parent), str(staged_dir)
+
+
 @pytest.mark.bsl
 class TestApplyStagedVersion:
     """Test _apply_staged_version() - success and failure cases."""
@@ -268,25 +362,17 @@ class TestApplyStagedVersion:
 
         assert result is None
 
-    def test_apply_staged_version_empty_staged_dir(self, tmp_path: Any) -> None:
+    def test_apply_staged_version_empty_staged_dir(self, staged_tree: tuple[str, str, str]) -> None:
         """Test that None is returned when staged directory is empty."""
-        static_dir = str(tmp_path / "static")
-        bsl_dir = str(tmp_path / "bsl-ls")
-        staged_dir = os.path.join(bsl_dir, STAGED_DIR_NAME)
-        os.makedirs(static_dir, exist_ok=True)
-        os.makedirs(staged_dir, exist_ok=True)
+        static_dir, bsl_dir, staged_dir = staged_tree
 
         result = BslLanguageServer._apply_staged_version(static_dir, bsl_dir)
 
         assert result is None
 
-    def test_apply_staged_version_success(self, tmp_path: Any) -> None:
+    def test_apply_staged_version_success(self, staged_tree: tuple[str, str, str]) -> None:
         """Test successful staged version application."""
-        static_dir = str(tmp_path / "static")
-        bsl_dir = str(tmp_path / "bsl-ls")
-        staged_dir = os.path.join(bsl_dir, STAGED_DIR_NAME)
-        os.makedirs(static_dir, exist_ok=True)
-        os.makedirs(staged_dir, exist_ok=True)
+        static_dir, bsl_dir, staged_dir = staged_tree
 
         # Create staged JAR
         staged_jar_name = "bsl-language-server-0.29.0-exec.jar"
@@ -317,13 +403,9 @@ class TestApplyStagedVersion:
         # Verify staged directory was cleaned up
         assert not os.path.exists(staged_dir)
 
-    def test_apply_staged_version_removes_old_jar(self, tmp_path: Any) -> None:
+    def test_apply_staged_version_removes_old_jar(self, staged_tree: tuple[str, str, str]) -> None:
         """Test that old JAR is removed when applying staged version."""
-        static_dir = str(tmp_path / "static")
-        bsl_dir = str(tmp_path / "bsl-ls")
-        staged_dir = os.path.join(bsl_dir, STAGED_DIR_NAME)
-        os.makedirs(static_dir, exist_ok=True)
-        os.makedirs(staged_dir, exist_ok=True)
+        static_dir, bsl_dir, staged_dir = staged_tree
 
         # Create old JAR in main directory
         old_jar_name = "bsl-language-server-0.28.0-exec.jar"
@@ -348,13 +430,25 @@ class TestApplyStagedVersion:
         with open(result) as f:
             assert f.read() == "staged jar content"
 
-    def test_apply_staged_version_no_jars_in_staged(self, tmp_path: Any) -> None:
+    def test_apply_staged_version_replaces_same_name(self, staged_tree: tuple[str, str, str]) -> None:
+        """Test that a staged JAR with the same name as the installed one replaces it."""
+        static_dir, bsl_dir, staged_dir = staged_tree
+        jar_name = "bsl-language-server-0.29.0-exec.jar"
+        with open(os.path.join(bsl_dir, jar_name), "w") as f:
+            f.write("incomplete jar content")
+        with open(os.path.join(staged_dir, jar_name), "w") as f:
+            f.write("staged jar content")
+
+        result = BslLanguageServer._apply_staged_version(static_dir, bsl_dir)
+
+        assert result == os.path.join(bsl_dir, jar_name)
+        with open(result) as f:
+            assert f.read() == "staged jar content"
+        assert not os.path.exists(staged_dir)
+
+    def test_apply_staged_version_no_jars_in_staged(self, staged_tree: tuple[str, str, str]) -> None:
         """Test that None is returned when staged directory has no JAR files."""
-        static_dir = str(tmp_path / "static")
-        bsl_dir = str(tmp_path / "bsl-ls")
-        staged_dir = os.path.join(bsl_dir, STAGED_DIR_NAME)
-        os.makedirs(static_dir, exist_ok=True)
-        os.makedirs(staged_dir, exist_ok=True)
+        static_dir, bsl_dir, staged_dir = staged_tree
 
         # Create non-JAR file in staged directory
         other_file = os.path.join(staged_dir, "readme.txt")
@@ -386,7 +480,7 @@ class TestReadWriteVersionInfo:
         static_dir = str(tmp_path)
         version_file = os.path.join(static_dir, VERSION_FILENAME)
 
-        data = {"current": "v0.28.0", "staged": "v0.29.0", "last_check": "2024-01-15T12:00:00Z", "pinned": None}
+        data = {"current": "v0.28.0", "staged": "v0.29.0", "last_check": 1705320000, "pinned": None}
         with open(version_file, "w") as f:
             json.dump(data, f)
 
@@ -394,7 +488,7 @@ class TestReadWriteVersionInfo:
 
         assert result.current == "v0.28.0"
         assert result.staged == "v0.29.0"
-        assert result.last_check == "2024-01-15T12:00:00Z"
+        assert result.last_check == 1705320000
         assert result.pinned is None
 
     def test_read_version_info_invalid_json(self, tmp_path: Any) -> None:
@@ -415,7 +509,7 @@ class TestReadWriteVersionInfo:
         static_dir = str(tmp_path)
         version_file = os.path.join(static_dir, VERSION_FILENAME)
 
-        version_info = VersionInfo(current="v0.28.0", staged=None, last_check="2024-01-15T12:00:00Z", pinned="v0.28.0")
+        version_info = VersionInfo(current="v0.28.0", staged=None, last_check=1705320000, pinned="v0.28.0")
 
         BslLanguageServer._write_version_info(static_dir, version_info)
 
@@ -425,14 +519,14 @@ class TestReadWriteVersionInfo:
 
         assert data["current"] == "v0.28.0"
         assert data["staged"] is None
-        assert data["last_check"] == "2024-01-15T12:00:00Z"
+        assert data["last_check"] == 1705320000
         assert data["pinned"] == "v0.28.0"
 
     def test_write_and_read_roundtrip(self, tmp_path: Any) -> None:
         """Test that write followed by read returns the same data."""
         static_dir = str(tmp_path)
 
-        original = VersionInfo(current="v1.0.0", staged="v1.1.0", last_check="2024-06-15T08:30:00Z", pinned=None)
+        original = VersionInfo(current="v1.0.0", staged="v1.1.0", last_check=1718440200, pinned=None)
 
         BslLanguageServer._write_version_info(static_dir, original)
         result = BslLanguageServer._read_version_info(static_dir)
@@ -442,6 +536,257 @@ class TestReadWriteVersionInfo:
         assert result.last_check == original.last_check
         assert result.pinned == original.pinned
 
+    def test_write_version_info_atomic(self, tmp_path: Any) -> None:
+        """Test that a failed write keeps the previous version.json intact and leaves no temporary files."""
+        static_dir = str(tmp_path)
+        BslLanguageServer._write_version_info(static_dir, VersionInfo(current="v1.0.0"))
+
+        with patch("solidlsp.language_servers.bsl_language_server.os.fsync", side_effect=OSError("disk full")):
+            BslLanguageServer._write_version_info(static_dir, VersionInfo(current="v2.0.0"))
+
+        assert json.loads((tmp_path / VERSION_FILENAME).read_text())["current"] == "v1.0.0"
+        assert os.listdir(static_dir) == [VERSION_FILENAME]
+
+    def test_read_version_info_cached_until_modified(self, tmp_path: Any) -> None:
+        """Test that an unchanged version.json is not parsed again, and that external modifications are picked up."""
+        static_dir = str(tmp_path)
+        version_file = tmp_path / VERSION_FILENAME
+        BslLanguageServer._write_version_info(static_dir, VersionInfo(current="v1.0.0"))
+
+        with patch("solidlsp.language_servers.bsl_language_server.json.loads", side_effect=AssertionError("unexpected parse")):
+            cached = BslLanguageServer._read_version_info(static_dir)
+        assert cached.current == "v1.0.0"
+
+        # the cached object is shared, so it must not be mutable
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cached.current = "mutated"  # type: ignore[misc]
+
+        version_file.write_text(json.dumps({"current": "v2.0.0-external"}))
+        assert BslLanguageServer._read_version_info(static_dir).current == "v2.0.0-external"
+
+    def test_read_version_info_detects_replace_within_mtime_tick(self, tmp_path: Any) -> None:
+        """Test that a version.json replaced by another process with the same size and mtime is read again."""
+        static_dir = str(tmp_path)
+        version_file = tmp_path / VERSION_FILENAME
+        BslLanguageServer._write_version_info(static_dir, VersionInfo(current="v1.0.0"))
+        st = os.stat(version_file)
+
+        # another process atomically replaces the file with content of the same size within the same mtime tick
+        replacement = tmp_path / "version.json.other"
+        replacement.write_bytes(version_file.read_bytes().replace(b"v1.0.0", b"v1.0.1"))
+        os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(replacement, version_file)
+
+        assert BslLanguageServer._read_version_info(static_dir).current == "v1.0.1"
+
+
+@pytest.mark.bsl
+class TestInstalledManifest:
+    """Test _read_installed_manifest and _write_installed_manifest methods."""
+
+    def test_manifest_roundtrip(self, tmp_path: Any) -> None:
+        """Test that the written JAR path and version are read back."""
+        jar_path = tmp_path / "bsl-language-server-0.28.0-exec.jar"
+        jar_path.write_text("jar content")
+
+        BslLanguageServer._write_installed_manifest(str(tmp_path), str(jar_path), "v0.28.0")
+        result = BslLanguageServer._read_installed_manifest(str(tmp_path))
+
+        assert result == (str(jar_path), "v0.28.0")
+
+    def test_manifest_missing(self, tmp_path: Any) -> None:
+        """Test that None is returned when no manifest exists."""
+        result = BslLanguageServer._read_installed_manifest(str(tmp_path))
+
+        assert result is None
+
+    def test_manifest_jar_removed(self, tmp_path: Any) -> None:
+        """Test that None is returned when the recorded JAR no longer exists."""
+        jar_path = tmp_path / "bsl-language-server-0.28.0-exec.jar"
+        BslLanguageServer._write_installed_manifest(str(tmp_path), str(jar_path), "v0.28.0")
+
+        result = BslLanguageServer._read_installed_manifest(str(tmp_path))
+
+        assert result is None
+
+    def test_manifest_invalid_json(self, tmp_path: Any) -> None:
+        """Test that None is returned for a corrupted manifest."""
+        (tmp_path / INSTALLED_MANIFEST_FILENAME).write_text("not valid json {{{")
+
+        result = BslLanguageServer._read_installed_manifest(str(tmp_path))
+
+        assert result is None
+
+
+@pytest.mark.bsl
+class TestFindExecJar:
+    """Test _find_exec_jar() - JAR discovery in the bsl-ls and staged directories."""
+
+    def test_find_exec_jar(self, tmp_path: Any) -> None:
+        """Test that the executable JAR is found among other files."""
+        (tmp_path / INSTALLED_MANIFEST_FILENAME).write_text("{}")
+        (tmp_path / "bsl-language-server-0.28.0.jar").write_text("plain jar")
+        (tmp_path / "bsl-language-server-0.28.0-exec.jar").write_text("jar content")
+
+        result = BslLanguageServer._find_exec_jar(str(tmp_path))
+
+        assert result is not None
+        assert result.path == str(tmp_path / "bsl-language-server-0.28.0-exec.jar")
+
+    def test_find_exec_jar_none(self, tmp_path: Any) -> None:
+        """Test that None is returned for a directory without JARs and for a missing directory."""
+        (tmp_path / "readme.txt").write_text("text")
+
+        assert BslLanguageServer._find_exec_jar(str(tmp_path)) is None
+        assert BslLanguageServer._find_exec_jar(str(tmp_path / "missing")) is None
+
+    def test_find_exec_jar_skips_directories(self, tmp_path: Any) -> None:
+        """Test that a directory with a JAR-like name is not mistaken for the executable JAR."""
+        (tmp_path / "bsl-language-server-0.27.0-exec.jar").mkdir()
+
+        assert BslLanguageServer._find_exec_jar(str(tmp_path)) is None
+
+
+@pytest.mark.bsl
+class TestIsDownloadComplete:
+    """Test _is_download_complete() - reuse of previously downloaded JARs."""
+
+    def test_matching_size(self, tmp_path: Any) -> None:
+        """Test that a file with the expected size is considered complete."""
+        jar_path = tmp_path / "bsl-language-server-0.28.0-exec.jar"
+        jar_path.write_bytes(b"x" * 10)
+
+        assert BslLanguageServer._is_download_complete(str(jar_path), 10)
+
+    def test_size_mismatch(self, tmp_path: Any) -> None:
+        """Test that a truncated file is not considered complete."""
+        jar_path = tmp_path / "bsl-language-server-0.28.0-exec.jar"
+        jar_path.write_bytes(b"x" * 5)
+
+        assert not BslLanguageServer._is_download_complete(str(jar_path), 10)
+
+    def test_checksum(self, tmp_path: Any) -> None:
+        """Test that a file with the expected size is only considered complete if its checksum matches as well."""
+        jar_path = tmp_path / "bsl-language-server-0.28.0-exec.jar"
+        jar_path.write_bytes(b"x" * 10)
+
+        assert BslLanguageServer._is_download_complete(str(jar_path), 10, hashlib.sha256(b"x" * 10).hexdigest())
+        assert not BslLanguageServer._is_download_complete(str(jar_path), 10, hashlib.sha256(b"y" * 10).hexdigest())
+
+    def test_missing_file_or_unknown_size(self, tmp_path: Any) -> None:
+        """Test that a missing file or an unknown expected size requires a download."""
+        jar_path = tmp_path / "bsl-language-server-0.28.0-exec.jar"
+        assert not BslLanguageServer._is_download_complete(str(jar_path), 10)
+
+        jar_path.write_bytes(b"x" * 10)
+        assert not BslLanguageServer._is_download_complete(str(jar_path), None)
+
+
+@pytest.mark.bsl
+class TestIsViableJar:
+    """Test _is_viable_jar() - sanity check of existing JARs before starting Java."""
+
+    def test_valid_jar(self, tmp_path: Any) -> None:
+        """Test that a readable zip archive is accepted."""
+        jar_path = tmp_path / "bsl-language-server-0.28.0-exec.jar"
+        with zipfile.ZipFile(jar_path, "w") as jar:
+            jar.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n")
+
+        assert BslLanguageServer._is_viable_jar(str(jar_path))
+
+    def test_truncated_or_missing_jar(self, tmp_path: Any) -> None:
+        """Test that a truncated JAR and a missing file are rejected."""
+        jar_path = tmp_path / "bsl-language-server-0.28.0-exec.jar"
+        with zipfile.ZipFile(jar_path, "w") as jar:
+            jar.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n")
+        jar_path.write_bytes(jar_path.read_bytes()[:20])
+
+        assert not BslLanguageServer._is_viable_jar(str(jar_path))
+        assert not BslLanguageServer._is_viable_jar(str(tmp_path / "missing.jar"))
+
+    def test_unreadable_jar_kept(self, tmp_path: Any) -> None:
+        """Test that a JAR which cannot be read temporarily (e.g. locked by a virus scanner) is not considered corrupt."""
+        jar_path = tmp_path / "bsl-language-server-0.28.0-exec.jar"
+        jar_path.write_bytes(b"jar")
+
+        with patch("solidlsp.language_servers.bsl_language_server.zipfile.ZipFile", side_effect=PermissionError("locked")):
+            assert BslLanguageServer._is_viable_jar(str(jar_path))
+
+
+def _fake_download(content: bytes) -> Callable[..., None]:
+    """Create a replacement for FileUtils.download_file_verified which writes the given content to the target path."""
+
+    def fake_download(url: str, target_path: str, **kwargs: Any) -> None:
+        with open(target_path, "wb") as f:
+            f.write(content)
+
+    return fake_download
+
+
+@pytest.mark.bsl
+class TestSetupBslJar:
+    """Test _setup_bsl_jar() - locating or downloading the JAR at startup."""
+
+    def test_setup_bsl_jar_records_pinned_version(self, tmp_path: Any) -> None:
+        """Test that downloading a pinned version records it in version.json once, and returns the updated version info."""
+        static_dir = tmp_path
+        bsl_dir = tmp_path / "bsl-ls"
+        bsl_dir.mkdir()
+        settings = SolidLSPSettings(ls_specific_settings={Language.BSL: {"version": "0.28.0"}})
+        release_asset = BslReleaseAsset("https://github.com/x/bsl-language-server-0.28.0-exec.jar", "v0.28.0")
+
+        with (
+            patch.object(BslLanguageServer, "_get_pinned_or_latest_version", return_value=(release_asset, True)),
+            patch("solidlsp.language_servers.bsl_language_server.FileUtils.download_file_verified", side_effect=_fake_download(b"jar")),
+        ):
+            jar_path, version, version_info = BslLanguageServer._setup_bsl_jar(settings, str(static_dir), str(bsl_dir), VersionInfo())
+
+        assert jar_path == str(bsl_dir / "bsl-language-server-0.28.0-exec.jar")
+        assert version == "v0.28.0"
+        assert version_info == VersionInfo(current="v0.28.0", pinned="0.28.0")
+        assert json.loads((static_dir / VERSION_FILENAME).read_text())["pinned"] == "0.28.0"
+
+
+@pytest.mark.bsl
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix permission bits are not meaningful on Windows")
+class TestEnsureExecutable:
+    """Test _ensure_executable() - permission fix-up of the Java binary."""
+
+    def test_ensure_executable_sets_exec_bits(self, tmp_path: Any) -> None:
+        """Test that missing execute bits are added."""
+        binary = tmp_path / "java"
+        binary.write_text("")
+        os.chmod(binary, 0o644)
+
+        BslLanguageServer._ensure_executable(str(binary))
+
+        assert os.stat(binary).st_mode & 0o777 == 0o755
+
+    def test_ensure_executable_keeps_executable_file(self, tmp_path: Any) -> None:
+        """Test that an already executable file keeps its permissions."""
+        binary = tmp_path / "java"
+        binary.write_text("")
+        os.chmod(binary, 0o711)
+
+        BslLanguageServer._ensure_executable(str(binary))
+
+        assert os.stat(binary).st_mode & 0o777 == 0o711
+
+
+@pytest.mark.bsl
+class TestUpdateLock:
+    """Test _update_lock() - non-blocking inter-process update lock."""
+
+    def test_update_lock_exclusive(self, tmp_path: Any) -> None:
+        """Test that the lock cannot be acquired twice and is released on exit."""
+        with _update_lock(str(tmp_path)) as acquired:
+            assert acquired
+            with _update_lock(str(tmp_path)) as acquired_again:
+                assert not acquired_again
+
+        with _update_lock(str(tmp_path)) as acquired:
+            assert acquired
+
 
 @pytest.mark.bsl
 class TestShouldCheckForUpdates:
@@ -465,13 +810,9 @@ class TestShouldCheckForUpdates:
 
     def test_should_check_when_enough_time_passed(self) -> None:
         """Test that update check is performed when enough time has passed."""
-        from datetime import UTC, datetime, timedelta
-
-        from solidlsp.language_servers.bsl_language_server import UPDATE_CHECK_INTERVAL_SECONDS
-
         # Set last check to be old enough
-        old_time = datetime.now(UTC) - timedelta(seconds=UPDATE_CHECK_INTERVAL_SECONDS + 100)
-        version_info = VersionInfo(current="v0.28.0", last_check=old_time.isoformat())
+        old_time = int(time.time()) - UPDATE_CHECK_INTERVAL_SECONDS - 100
+        version_info = VersionInfo(current="v0.28.0", last_check=old_time)
 
         result = BslLanguageServer._should_check_for_updates(version_info)
 
@@ -479,45 +820,260 @@ class TestShouldCheckForUpdates:
 
     def test_should_not_check_when_recently_checked(self) -> None:
         """Test that update check is skipped when recently checked."""
-        from datetime import UTC, datetime
-
         # Set last check to now
-        version_info = VersionInfo(current="v0.28.0", last_check=datetime.now(UTC).isoformat())
+        version_info = VersionInfo(current="v0.28.0", last_check=int(time.time()))
 
         result = BslLanguageServer._should_check_for_updates(version_info)
 
         assert result is False
 
     def test_should_check_when_invalid_timestamp(self) -> None:
-        """Test that update check is performed when timestamp is invalid."""
-        version_info = VersionInfo(current="v0.28.0", last_check="invalid-timestamp")
+        """Test that update check is performed when the stored timestamp is invalid."""
+        version_info = VersionInfo.from_dict({"current": "v0.28.0", "last_check": "invalid-timestamp"})
 
         result = BslLanguageServer._should_check_for_updates(version_info)
 
         assert result is True
 
 
+@pytest.mark.bsl
+class TestStartBackgroundUpdateCheck:
+    """Test _start_background_update_check() - thread is only spawned when a check is due."""
+
+    def test_no_thread_when_not_due(self, tmp_path: Any) -> None:
+        """Test that the given version info is used and no thread is started when recently checked."""
+        version_info = VersionInfo(current="v0.28.0", last_check=int(time.time()))
+
+        with patch("solidlsp.language_servers.bsl_language_server.threading.Thread") as mock_thread:
+            with patch.object(BslLanguageServer, "_read_version_info", side_effect=AssertionError("unexpected read")):
+                BslLanguageServer._start_background_update_check("v0.28.0", str(tmp_path), str(tmp_path), version_info)
+
+        mock_thread.assert_not_called()
+
+    def test_thread_when_due(self, tmp_path: Any) -> None:
+        """Test that a thread is started when no check has been performed yet."""
+        with patch("solidlsp.language_servers.bsl_language_server.threading.Thread") as mock_thread:
+            BslLanguageServer._start_background_update_check("v0.28.0", str(tmp_path), str(tmp_path), VersionInfo(current="v0.28.0"))
+
+        mock_thread.assert_called_once()
+        mock_thread.return_value.start.assert_called_once()
+
+
+@pytest.mark.bsl
+class TestCheckAndDownloadUpdate:
+    """Test _check_and_download_update() - local short-circuit before contacting GitHub."""
+
+    def test_recent_jar_skips_github(self, tmp_path: Any) -> None:
+        """Test that a freshly installed JAR is considered current without fetching the latest release."""
+        static_dir = tmp_path
+        bsl_dir = tmp_path / "bsl-ls"
+        bsl_dir.mkdir()
+        jar_path = bsl_dir / "bsl-language-server-0.28.0-exec.jar"
+        jar_path.write_text("jar content")
+        BslLanguageServer._write_installed_manifest(str(bsl_dir), str(jar_path), "v0.28.0")
+
+        with patch.object(BslLanguageServer, "_get_latest_bsl_release_url") as mock_latest:
+            BslLanguageServer._check_and_download_update("v0.28.0", str(static_dir), str(bsl_dir))
+
+        mock_latest.assert_not_called()
+        assert BslLanguageServer._read_version_info(str(static_dir)).last_check is not None
+
+    def test_old_jar_checks_github(self, tmp_path: Any) -> None:
+        """Test that the latest release is fetched once the installed JAR is older than the check interval."""
+        static_dir = tmp_path
+        bsl_dir = tmp_path / "bsl-ls"
+        bsl_dir.mkdir()
+        jar_path = bsl_dir / "bsl-language-server-0.28.0-exec.jar"
+        jar_path.write_text("jar content")
+        old_time = time.time() - UPDATE_CHECK_INTERVAL_SECONDS - 100
+        os.utime(jar_path, (old_time, old_time))
+        BslLanguageServer._write_installed_manifest(str(bsl_dir), str(jar_path), "v0.28.0")
+
+        latest = BslReleaseAsset("https://example.com/bsl-language-server-0.28.0-exec.jar", "v0.28.0")
+        with patch.object(BslLanguageServer, "_get_latest_bsl_release_url", return_value=latest) as mock_latest:
+            BslLanguageServer._check_and_download_update("v0.28.0", str(static_dir), str(bsl_dir))
+
+        mock_latest.assert_called_once()
+
+    def test_too_small_asset_not_downloaded(self, tmp_path: Any) -> None:
+        """Test that an asset with an implausibly small advertised size is not downloaded."""
+        bsl_dir = tmp_path / "bsl-ls"
+        bsl_dir.mkdir()
+        latest = BslReleaseAsset("https://example.com/bsl-language-server-0.29.0-exec.jar", "v0.29.0", size=1024)
+
+        with patch.object(BslLanguageServer, "_get_latest_bsl_release_url", return_value=latest):
+            with patch("solidlsp.language_servers.bsl_language_server.FileUtils.download_file_verified") as mock_download:
+                BslLanguageServer._check_and_download_update("v0.28.0", str(tmp_path), str(bsl_dir))
+
+        mock_download.assert_not_called()
+
+    def test_already_staged_latest_not_downloaded(self, tmp_path: Any) -> None:
+        """Test that no download happens when the latest version is already staged."""
+        bsl_dir = tmp_path / "bsl-ls"
+        staged_dir = bsl_dir / STAGED_DIR_NAME
+        staged_dir.mkdir(parents=True)
+        (staged_dir / "bsl-language-server-0.29.0-exec.jar").write_text("jar content")
+        BslLanguageServer._write_version_info(str(tmp_path), VersionInfo(current="v0.28.0", staged="v0.29.0"))
+        latest = BslReleaseAsset("https://example.com/bsl-language-server-0.29.0-exec.jar", "v0.29.0")
+
+        with patch.object(BslLanguageServer, "_get_latest_bsl_release_url", return_value=latest):
+            with patch("solidlsp.language_servers.bsl_language_server.FileUtils.download_file_verified") as mock_download:
+                BslLanguageServer._check_and_download_update("v0.28.0", str(tmp_path), str(bsl_dir))
+
+        mock_download.assert_not_called()
+        version_info = BslLanguageServer._read_version_info(str(tmp_path))
+        assert version_info.staged == "v0.29.0"
+        assert version_info.last_check is not None
+
+    def test_incomplete_download_not_staged(self, tmp_path: Any) -> None:
+        """Test that a download whose size differs from the advertised asset size is discarded."""
+        bsl_dir = tmp_path / "bsl-ls"
+        bsl_dir.mkdir()
+        latest = BslReleaseAsset("https://example.com/bsl-language-server-0.29.0-exec.jar", "v0.29.0", size=4 * 1024 * 1024)
+
+        with patch.object(BslLanguageServer, "_get_latest_bsl_release_url", return_value=latest):
+            with patch(
+                "solidlsp.language_servers.bsl_language_server.FileUtils.download_file_verified",
+                side_effect=_fake_download(b"x" * (2 * 1024 * 1024)),
+            ):
+                BslLanguageServer._check_and_download_update("v0.28.0", str(tmp_path), str(bsl_dir))
+
+        assert os.listdir(bsl_dir / STAGED_DIR_NAME) == []
+        assert BslLanguageServer._read_version_info(str(tmp_path)).staged is None
+
+    def test_download_staged_with_single_metadata_write(self, tmp_path: Any) -> None:
+        """Test that a new release is staged and last check time and staged version are written together."""
+        bsl_dir = tmp_path / "bsl-ls"
+        bsl_dir.mkdir()
+        jar_size = 2 * 1024 * 1024
+        latest = BslReleaseAsset("https://example.com/bsl-language-server-0.29.0-exec.jar", "v0.29.0", size=jar_size)
+
+        with patch.object(BslLanguageServer, "_get_latest_bsl_release_url", return_value=latest):
+            with patch(
+                "solidlsp.language_servers.bsl_language_server.FileUtils.download_file_verified",
+                side_effect=_fake_download(b"x" * jar_size),
+            ):
+                with patch.object(BslLanguageServer, "_write_version_info", wraps=BslLanguageServer._write_version_info) as mock_write:
+                    BslLanguageServer._check_and_download_update("v0.28.0", str(tmp_path), str(bsl_dir))
+
+        assert os.listdir(bsl_dir / STAGED_DIR_NAME) == ["bsl-language-server-0.29.0-exec.jar"]
+        assert mock_write.call_count == 1
+        version_info = BslLanguageServer._read_version_info(str(tmp_path))
+        assert version_info.staged == "v0.29.0"
+        assert version_info.last_check is not None
+
+    def test_download_runs_without_update_lock(self, tmp_path: Any) -> None:
+        """Test that the update lock is free while the JAR is being downloaded."""
+        bsl_dir = tmp_path / "bsl-ls"
+        bsl_dir.mkdir()
+        jar_size = 2 * 1024 * 1024
+        latest = BslReleaseAsset("https://example.com/bsl-language-server-0.29.0-exec.jar", "v0.29.0", size=jar_size)
+        lock_available = []
+
+        def fake_download(url: str, target_path: str, **kwargs: Any) -> None:
+            with open(tmp_path / LOCK_FILENAME, "a") as lock_fd:
+                acquired = _lock_file(lock_fd)
+                lock_available.append(acquired)
+                if acquired:
+                    _unlock_file(lock_fd)
+            _fake_download(b"x" * jar_size)(url, target_path)
+
+        with patch.object(BslLanguageServer, "_get_latest_bsl_release_url", return_value=latest):
+            with patch("solidlsp.language_servers.bsl_language_server.FileUtils.download_file_verified", side_effect=fake_download):
+                BslLanguageServer._check_and_download_update("v0.28.0", str(tmp_path), str(bsl_dir))
+
+        assert lock_available == [True]
+        assert os.listdir(bsl_dir / STAGED_DIR_NAME) == ["bsl-language-server-0.29.0-exec.jar"]
+
+    def test_download_not_published_if_staged_concurrently(self, tmp_path: Any) -> None:
+        """Test that a JAR staged by another process during the download is not overwritten."""
+        bsl_dir = tmp_path / "bsl-ls"
+        bsl_dir.mkdir()
+        jar_size = 2 * 1024 * 1024
+        latest = BslReleaseAsset("https://example.com/bsl-language-server-0.29.0-exec.jar", "v0.29.0", size=jar_size)
+        staged_jar_path = bsl_dir / STAGED_DIR_NAME / "bsl-language-server-0.29.0-exec.jar"
+
+        def fake_download(url: str, target_path: str, **kwargs: Any) -> None:
+            # another process stages the same version while this one is downloading
+            staged_jar_path.write_bytes(b"y" * jar_size)
+            BslLanguageServer._write_version_info(str(tmp_path), VersionInfo(current="v0.28.0", staged="v0.29.0"))
+            _fake_download(b"x" * jar_size)(url, target_path)
+
+        with patch.object(BslLanguageServer, "_get_latest_bsl_release_url", return_value=latest):
+            with patch("solidlsp.language_servers.bsl_language_server.FileUtils.download_file_verified", side_effect=fake_download):
+                BslLanguageServer._check_and_download_update("v0.28.0", str(tmp_path), str(bsl_dir))
+
+        assert os.listdir(bsl_dir / STAGED_DIR_NAME) == ["bsl-language-server-0.29.0-exec.jar"]
+        assert staged_jar_path.read_bytes() == b"y" * jar_size
+        version_info = BslLanguageServer._read_version_info(str(tmp_path))
+        assert version_info.staged == "v0.29.0"
+        assert version_info.last_check is not None
+
+    def test_download_not_published_if_installed_concurrently(self, tmp_path: Any) -> None:
+        """Test that a version installed by another process during the download is not staged again."""
+        bsl_dir = tmp_path / "bsl-ls"
+        bsl_dir.mkdir()
+        jar_size = 2 * 1024 * 1024
+        latest = BslReleaseAsset("https://example.com/bsl-language-server-0.29.0-exec.jar", "v0.29.0", size=jar_size)
+
+        def fake_download(url: str, target_path: str, **kwargs: Any) -> None:
+            # another process installs the same version while this one is downloading
+            installed_jar_path = bsl_dir / "bsl-language-server-0.29.0-exec.jar"
+            installed_jar_path.write_bytes(b"y" * jar_size)
+            BslLanguageServer._write_installed_manifest(str(bsl_dir), str(installed_jar_path), "v0.29.0")
+            _fake_download(b"x" * jar_size)(url, target_path)
+
+        with patch.object(BslLanguageServer, "_get_latest_bsl_release_url", return_value=latest):
+            with patch("solidlsp.language_servers.bsl_language_server.FileUtils.download_file_verified", side_effect=fake_download):
+                BslLanguageServer._check_and_download_update("v0.28.0", str(tmp_path), str(bsl_dir))
+
+        assert os.listdir(bsl_dir / STAGED_DIR_NAME) == []
+        assert BslLanguageServer._read_version_info(str(tmp_path)).staged is None
+
+    def test_download_temp_paths_unique(self, tmp_path: Any) -> None:
+        """Test that update checks in the same process download to distinct temp files."""
+        bsl_dir = tmp_path / "bsl-ls"
+        bsl_dir.mkdir()
+        latest = BslReleaseAsset("https://example.com/bsl-language-server-0.29.0-exec.jar", "v0.29.0", size=4 * 1024 * 1024)
+        temp_paths = []
+
+        def fake_download(url: str, target_path: str, **kwargs: Any) -> None:
+            temp_paths.append(target_path)
+
+        with patch.object(BslLanguageServer, "_get_latest_bsl_release_url", return_value=latest):
+            with patch("solidlsp.language_servers.bsl_language_server.FileUtils.download_file_verified", side_effect=fake_download):
+                BslLanguageServer._check_and_download_update("v0.28.0", str(tmp_path), str(bsl_dir))
+                BslLanguageServer._check_and_download_update("v0.28.0", str(tmp_path), str(bsl_dir))
+
+        assert len(temp_paths) == 2
+        assert temp_paths[0] != temp_paths[1]
+
+
 @pytest.mark.bsl
 class TestParseGitHubReleaseResponse:
     """Test version parsing from GitHub releases API response."""
 
+    @staticmethod
+    def _find_release_asset(releases: list[dict[str, Any]], version: str, cache_dir: str) -> BslReleaseAsset | None:
+        """Look up a version with _get_release_url_for_version, serving the given list of releases (the tag endpoint is a 404)."""
+
+        def fake_fetch(url: str, cache_dir: str | None = None, cache_filename: str | None = None) -> Any:
+            if "/releases/tags/" in url:
+                raise requests.HTTPError("not found", response=_FakeHttpResponse(b"", status_code=404))  # type: ignore[arg-type]
+            return releases
+
+        with patch.object(BslLanguageServer, "_fetch_github_json", side_effect=fake_fetch):
+            return BslLanguageServer._get_release_url_for_version(version, cache_dir)
+
     def test_parse_latest_release_finds_exec_jar(self) -> None:
-        """Test that the parsing logic correctly identifies -exec.jar assets."""
-        # This tests the logic pattern used in _get_latest_bsl_release_url
-        # We test the asset filtering logic without making network calls
+        """Test that the asset filter used by the release lookups identifies the -exec.jar asset."""
         assets = [
             {"name": "bsl-language-server-0.28.0.zip", "browser_download_url": "https://example.com/zip"},
             {"name": "bsl-language-server-0.28.0-exec.jar", "browser_download_url": "https://example.com/exec.jar"},
             {"name": "checksum.txt", "browser_download_url": "https://example.com/checksum"},
         ]
 
-        # Find the exec JAR (same logic as in _get_latest_bsl_release_url)
-        exec_jar = None
-        for asset in assets:
-            name = asset.get("name", "")
-            if name.endswith("-exec.jar"):
-                exec_jar = asset
-                break
+        exec_jar = next(filter(BslLanguageServer._is_exec_jar_asset, assets), None)
 
         assert exec_jar is not None
         assert exec_jar["name"] == "bsl-language-server-0.28.0-exec.jar"
@@ -528,87 +1084,268 @@ class TestParseGitHubReleaseResponse:
         assets = [
             {"name": "bsl-language-server-0.28.0.zip", "browser_download_url": "https://example.com/zip"},
             {"name": "checksum.txt", "browser_download_url": "https://example.com/checksum"},
+            {"browser_download_url": "https://example.com/unnamed"},
         ]
 
-        exec_jar = None
-        for asset in assets:
-            name = asset.get("name", "")
-            if name.endswith("-exec.jar"):
-                exec_jar = asset
-                break
-
-        assert exec_jar is None
+        assert next(filter(BslLanguageServer._is_exec_jar_asset, assets), None) is None
 
     def test_parse_release_empty_assets(self) -> None:
         """Test handling when assets list is empty."""
-        assets: list[dict[str, str]] = []
-
-        exec_jar = None
-        for asset in assets:
-            name = asset.get("name", "")
-            if name.endswith("-exec.jar"):
-                exec_jar = asset
-                break
+        assert next(filter(BslLanguageServer._is_exec_jar_asset, []), None) is None
 
-        assert exec_jar is None
-
-    def test_parse_release_version_matching(self) -> None:
-        """Test version matching logic for pinned versions."""
-        # This tests the logic in _get_release_url_for_version
+    def test_parse_release_version_matching(self, tmp_path: Any) -> None:
+        """Test version matching for pinned versions."""
         releases = [
             {"tag_name": "v0.28.0", "assets": [{"name": "bsl-language-server-0.28.0-exec.jar", "browser_download_url": "url1"}]},
             {"tag_name": "v0.27.0", "assets": [{"name": "bsl-language-server-0.27.0-exec.jar", "browser_download_url": "url2"}]},
             {"tag_name": "v0.26.0", "assets": [{"name": "bsl-language-server-0.26.0-exec.jar", "browser_download_url": "url3"}]},
         ]
 
-        # Test finding v0.27.0 (same logic as in _get_release_url_for_version)
-        target_version = "0.27.0"
-        normalized_version = f"v{target_version}" if not target_version.startswith("v") else target_version
-
-        found_release = None
-        for release in releases:
-            tag = release.get("tag_name", "")
-            if tag in (normalized_version, target_version):
-                found_release = release
-                break
+        release_asset = self._find_release_asset(releases, "0.27.0", str(tmp_path))
 
-        assert found_release is not None
-        assert found_release["tag_name"] == "v0.27.0"
+        assert release_asset is not None
+        assert release_asset.version == "v0.27.0"
+        assert release_asset.download_url == "url2"
 
-    def test_parse_release_version_with_v_prefix(self) -> None:
+    @pytest.mark.parametrize("target", ["v0.28.0", "0.28.0"])
+    def test_parse_release_version_with_v_prefix(self, target: str, tmp_path: Any) -> None:
         """Test version matching works with v prefix in both formats."""
         releases = [
             {"tag_name": "v0.28.0", "assets": [{"name": "bsl-language-server-0.28.0-exec.jar", "browser_download_url": "url"}]},
         ]
 
-        # Both "v0.28.0" and "0.28.0" should match
-        for target in ["v0.28.0", "0.28.0"]:
-            normalized = f"v{target}" if not target.startswith("v") else target
-
-            found = None
-            for release in releases:
-                tag = release.get("tag_name", "")
-                if tag in (normalized, target):
-                    found = release
-                    break
+        release_asset = self._find_release_asset(releases, target, str(tmp_path))
 
-            assert found is not None, f"Failed to match {target}"
+        assert release_asset is not None, f"Failed to match {target}"
+        assert release_asset.version == "v0.28.0"
 
-    def test_parse_release_version_not_found(self) -> None:
+    def test_parse_release_version_not_found(self, tmp_path: Any) -> None:
         """Test handling when requested version is not in releases list."""
         releases = [
             {"tag_name": "v0.28.0", "assets": []},
             {"tag_name": "v0.27.0", "assets": []},
         ]
 
-        target_version = "v0.25.0"
-        normalized_version = f"v{target_version}" if not target_version.startswith("v") else target_version
+        assert self._find_release_asset(releases, "v0.25.0", str(tmp_path)) is None
+
+
+class _FakeHttpResponse:
+    def __init__(self, payload: bytes, headers: dict[str, str] | None = None, status_code: int = 200) -> None:
+        self.content = payload
+        self.headers = headers or {}
+        self.status_code = status_code
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)  # type: ignore[arg-type]
+
+
+@pytest.mark.bsl
+class TestFetchGitHubJson:
+    """Test _fetch_github_json() - on-disk caching with conditional requests."""
+
+    URL = "https://api.github.com/repos/1c-syntax/bsl-language-server/releases/latest"
+
+    def test_fetch_writes_cache_and_validators(self, tmp_path: Any) -> None:
+        """Test that a fresh response is cached together with its ETag and Last-Modified headers."""
+        payload = json.dumps({"tag_name": "v0.28.0"}).encode("utf-8")
+        response = _FakeHttpResponse(payload, {"ETag": '"abc"', "Last-Modified": "Mon, 15 Jan 2024 12:00:00 GMT"})
+
+        with patch("solidlsp.language_servers.bsl_language_server._HTTP_SESSION.get", return_value=response):
+            result = BslLanguageServer._fetch_github_json(self.URL, str(tmp_path), "latest_release.json")
+
+        assert result == {"tag_name": "v0.28.0"}
+        assert (tmp_path / "latest_release.json").read_bytes() == payload
+        meta = json.loads((tmp_path / "latest_release.meta.json").read_text())
+        assert meta["etag"] == '"abc"'
+        assert meta["last_modified"] == "Mon, 15 Jan 2024 12:00:00 GMT"
+
+    def test_fetch_uses_fresh_cache_without_network(self, tmp_path: Any) -> None:
+        """Test that a cached response younger than the TTL is returned without a request."""
+        (tmp_path / "latest_release.json").write_text(json.dumps({"tag_name": "v0.28.0"}))
+        (tmp_path / "latest_release.meta.json").write_text(json.dumps({"etag": '"abc"', "fetched_at": time.time()}))
+
+        with patch("solidlsp.language_servers.bsl_language_server._HTTP_SESSION.get", side_effect=AssertionError("unexpected request")):
+            result = BslLanguageServer._fetch_github_json(self.URL, str(tmp_path), "latest_release.json")
+
+        assert result == {"tag_name": "v0.28.0"}
+
+    def test_fetch_revalidates_stale_cache(self, tmp_path: Any) -> None:
+        """Test that a stale cache is revalidated with If-None-Match and reused on 304."""
+        (tmp_path / "latest_release.json").write_text(json.dumps({"tag_name": "v0.28.0"}))
+        stale_time = time.time() - RELEASE_CACHE_TTL_SECONDS - 100
+        (tmp_path / "latest_release.meta.json").write_text(json.dumps({"etag": '"abc"', "fetched_at": stale_time}))
+
+        not_modified = _FakeHttpResponse(b"", status_code=304)
+        with patch("solidlsp.language_servers.bsl_language_server._HTTP_SESSION.get", return_value=not_modified) as mock_get:
+            result = BslLanguageServer._fetch_github_json(self.URL, str(tmp_path), "latest_release.json")
+
+        assert result == {"tag_name": "v0.28.0"}
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+        meta = json.loads((tmp_path / "latest_release.meta.json").read_text())
+        assert meta["fetched_at"] > stale_time
+
+    def test_fetch_revalidates_with_last_modified_only(self, tmp_path: Any) -> None:
+        """Test that If-Modified-Since is sent when the cached response had no ETag."""
+        (tmp_path / "latest_release.json").write_text(json.dumps({"tag_name": "v0.28.0"}))
+        stale_time = time.time() - RELEASE_CACHE_TTL_SECONDS - 100
+        last_modified = "Mon, 15 Jan 2024 12:00:00 GMT"
+        (tmp_path / "latest_release.meta.json").write_text(
+            json.dumps({"etag": None, "last_modified": last_modified, "fetched_at": stale_time})
+        )
+
+        not_modified = _FakeHttpResponse(b"", status_code=304)
+        with patch("solidlsp.language_servers.bsl_language_server._HTTP_SESSION.get", return_value=not_modified) as mock_get:
+            result = BslLanguageServer._fetch_github_json(self.URL, str(tmp_path), "latest_release.json")
+
+        assert result == {"tag_name": "v0.28.0"}
+        headers = mock_get.call_args.kwargs["headers"]
+        assert headers["If-Modified-Since"] == last_modified
+        assert "If-None-Match" not in headers
+
+    @pytest.mark.parametrize("status_code", [403, 429])
+    def test_fetch_rate_limited_uses_stale_cache(self, status_code: int, tmp_path: Any) -> None:
+        """Test that a rate-limited response falls back to the stale cached copy instead of failing."""
+        (tmp_path / "latest_release.json").write_text(json.dumps({"tag_name": "v0.28.0"}))
+        stale_time = time.time() - RELEASE_CACHE_TTL_SECONDS - 100
+        (tmp_path / "latest_release.meta.json").write_text(json.dumps({"etag": '"abc"', "fetched_at": stale_time}))
+
+        rate_limited = _FakeHttpResponse(b"", {"Retry-After": "3600"}, status_code=status_code)
+        with patch("solidlsp.language_servers.bsl_language_server._HTTP_SESSION.get", return_value=rate_limited):
+            result = BslLanguageServer._fetch_github_json(self.URL, str(tmp_path), "latest_release.json")
+
+        assert result == {"tag_name": "v0.28.0"}
+
+    def test_session_ignores_retry_after(self) -> None:
+        """Test that the shared session does not wait for Retry-After, so a rate limit cannot block the startup."""
+        retries = _HTTP_SESSION.get_adapter(self.URL).max_retries
+
+        assert not retries.respect_retry_after_header
+
+    RELEASE_0_27 = {
+        "tag_name": "v0.27.0",
+        "assets": [{"name": "bsl-language-server-0.27.0-exec.jar", "browser_download_url": "https://example.com/0.27.0.jar"}],
+    }
+
+    def test_release_for_version_fetches_single_tag(self, tmp_path: Any) -> None:
+        """Test that a pinned version is looked up via the per-tag endpoint and cached between lookups."""
+        response = _FakeHttpResponse(json.dumps(self.RELEASE_0_27).encode("utf-8"), {"ETag": '"release"'})
+
+        with patch("solidlsp.language_servers.bsl_language_server._HTTP_SESSION.get", return_value=response) as mock_get:
+            first = BslLanguageServer._get_release_url_for_version("0.27.0", str(tmp_path))
+            (tmp_path / "release_v0.27.0.json").unlink()
+            second = BslLanguageServer._get_release_url_for_version("v0.27.0", str(tmp_path))
+
+        assert first is not None and first.download_url == "https://example.com/0.27.0.jar"
+        assert second == first
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.args[0].endswith("/releases/tags/v0.27.0")
+
+    def test_release_for_version_falls_back_to_list(self, tmp_path: Any) -> None:
+        """Test that the list of all releases is searched when the per-tag endpoint returns 404."""
+        release = {
+            "tag_name": "0.26.0",
+            "assets": [{"name": "bsl-language-server-0.26.0-exec.jar", "browser_download_url": "https://example.com/0.26.0.jar"}],
+        }
+
+        def fake_get(url: str, **kwargs: Any) -> _FakeHttpResponse:
+            if "/releases/tags/" in url:
+                return _FakeHttpResponse(b"", status_code=404)
+            return _FakeHttpResponse(json.dumps([self.RELEASE_0_27, release]).encode("utf-8"))
+
+        with patch("solidlsp.language_servers.bsl_language_server._HTTP_SESSION.get", side_effect=fake_get):
+            result = BslLanguageServer._get_release_url_for_version("0.26.0", str(tmp_path))
+
+        assert result is not None
+        assert result.version == "0.26.0"
+        assert result.download_url == "https://example.com/0.26.0.jar"
+
+    def test_latest_release_memoized_in_process(self, tmp_path: Any) -> None:
+        """Test that the latest release is resolved from memory once looked up, even without the on-disk cache."""
+        release = {
+            "tag_name": "v0.28.0",
+            "assets": [
+                {"name": "bsl-language-server-0.28.0-exec.jar", "browser_download_url": "https://example.com/0.28.0.jar", "size": 10}
+            ],
+        }
+        response = _FakeHttpResponse(json.dumps(release).encode("utf-8"))
+
+        with patch("solidlsp.language_servers.bsl_language_server._HTTP_SESSION.get", return_value=response):
+            first = BslLanguageServer._get_latest_bsl_release_url(str(tmp_path))
+        (tmp_path / "latest_release.json").unlink()
+
+        with patch("solidlsp.language_servers.bsl_language_server._HTTP_SESSION.get", side_effect=AssertionError("unexpected request")):
+            second = BslLanguageServer._get_latest_bsl_release_url(str(tmp_path))
+
+        assert first.version == "v0.28.0"
+        assert first.size == 10
+        assert second == first
+
+    def test_release_asset_sha256_from_digest(self) -> None:
+        """Test that the SHA-256 digest published by GitHub is taken over, and other digest formats are ignored."""
+        asset = {"browser_download_url": "https://example.com/0.28.0.jar", "size": 10, "digest": "sha256:" + "ab" * 32}
+        assert BslReleaseAsset.from_github_asset(asset, "v0.28.0").sha256 == "ab" * 32
+
+        asset["digest"] = "md5:0123"
+        assert BslReleaseAsset.from_github_asset(asset, "v0.28.0").sha256 is None
+
+        del asset["digest"]
+        assert BslReleaseAsset.from_github_asset(asset, "v0.28.0").sha256 is None
+
+
+@pytest.mark.bsl
+class TestGetInitializeParams:
+    """Test _get_initialize_params() - per-repository fields on top of the static capabilities."""
+
+    def test_initialize_params_repository_fields(self, tmp_path: Any) -> None:
+        """Test that root path, root URI and workspace folders refer to the repository."""
+        repo_path = str(tmp_path)
+
+        params = BslLanguageServer._get_initialize_params(repo_path)
+
+        root_uri = tmp_path.as_uri()
+        assert params["rootPath"] == repo_path
+        assert params["rootUri"] == root_uri
+        assert params["workspaceFolders"] == [{"uri": root_uri, "name": tmp_path.name}]
+        assert params["processId"] == os.getpid()
+        assert params["trace"] == "off"
+        assert params["capabilities"]["textDocument"]["documentSymbol"]["hierarchicalDocumentSymbolSupport"] is True
+
+    def test_root_uri_special_characters(self, tmp_path: Any) -> None:
+        """Test that the root URI of a path with spaces and Cyrillic characters matches pathlib's file URI."""
+        repo_path = tmp_path / "Мой проект #1"
+        repo_path.mkdir()
+
+        params = BslLanguageServer._get_initialize_params(str(repo_path))
+
+        assert params["rootUri"] == repo_path.as_uri()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Undecodable file names only exist on POSIX")
+    def test_root_uri_undecodable_path(self, tmp_path: Any) -> None:
+        """Test that a path containing bytes that are not valid UTF-8 is percent-encoded byte by byte, as pathlib does."""
+        repo_path = os.fsdecode(os.fsencode(str(tmp_path)) + b"/caf\xe9")
+
+        params = BslLanguageServer._get_initialize_params(repo_path)
+
+        assert params["rootUri"] == pathlib.PurePosixPath(repo_path).as_uri()
+        assert params["rootUri"].endswith("/caf%E9")
+
+    @pytest.mark.parametrize(
+        "windows_path",
+        [r"C:\Users\user\Мой проект #1", "C:/Users/user/project", r"\\server\share\project"],
+    )
+    def test_root_uri_windows_paths(self, windows_path: str) -> None:
+        """Test that Windows drive and UNC paths are converted to the same file URIs as with pathlib."""
+        with patch("solidlsp.language_servers.bsl_language_server.os.name", "nt"):
+            uri = _path_to_file_uri(windows_path)
+
+        assert uri == pathlib.PureWindowsPath(windows_path).as_uri()
+
+    def test_initialize_params_fresh_top_level(self, tmp_path: Any) -> None:
+        """Test that repeated calls return independent top-level dicts."""
+        first = BslLanguageServer._get_initialize_params(str(tmp_path))
+        first["rootPath"] = "modified"
 
-        found_release = None
-        for release in releases:
-            tag = release.get("tag_name", "")
-            if tag in (normalized_version, target_version):
-                found_release = release
-                break
+        second = BslLanguageServer._get_initialize_params(str(tmp_path))
 
-        assert found_release is None
+        assert second["rootPath"] == str(tmp_path)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -40,3 +41,42 @@ def test_download_file_verified_writes_decoded_response_body(tmp_path: Path) ->
         )
 
     assert target_path.read_bytes() == payload
+
+
+def test_download_file_verified_uses_given_session(tmp_path: Path) -> None:
+    """A provided session should be used instead of a one-shot request."""
+    payload = b"jar-content"
+    target_path = tmp_path / "downloaded.jar"
+    url = "https://github.com/example/example.jar"
+
+    class _FakeSession:
+        def __init__(self) -> None:
+            self.requested_urls: list[str] = []
+
+        def get(self, requested_url: str, **kwargs):
+            self.requested_urls.append(requested_url)
+            return _FakeResponse(payload, requested_url)
+
+    session = _FakeSession()
+    with patch("solidlsp.ls_utils.requests.get", side_effect=AssertionError("unexpected one-shot request")):
+        FileUtils.download_file_verified(url, str(target_path), session=session)  # type: ignore[arg-type]
+
+    assert session.requested_urls == [url]
+    assert target_path.read_bytes() == payload
+
+
+def test_download_file_verified_fsync_leaves_no_temp_file(tmp_path: Path) -> None:
+    """With fsync enabled the file and its directory are synced and only the final file remains."""
+    payload = b"jar-content"
+    target_path = tmp_path / "downloaded.jar"
+    url = "https://github.com/example/example.jar"
+
+    with (
+        patch("solidlsp.ls_utils.requests.get", return_value=_FakeResponse(payload, url)),
+        patch("solidlsp.ls_utils.os.fsync") as mock_fsync,
+    ):
+        FileUtils.download_file_verified(url, str(target_path), fsync=True)
+
+    assert target_path.read_bytes() == payload
+    assert [p.name for p in tmp_path.iterdir()] == ["downloaded.jar"]
+    assert mock_fsync.call_count == (2 if os.name == "posix" else 1)